@@ -11,8 +11,14 @@ export const getJobs = async (params = {}) => {
   return res.data;
 };
 
-export const getStats = async () => {
-  const res = await axiosClient.get("/jobs/stats");
+export const getStats = async (params = {}) => {
+  const res = await axiosClient.get("/jobs/stats", { params });
+  return res.data;
+};
+
+// Archived jobs come back with archived: true and can only be restored
+export const restoreJob = async (id) => {
+  const res = await axiosClient.post(`/jobs/archive/${id}/restore`);
   return res.data;
 };
 
@@ -35,6 +41,14 @@ export const getCalendarEvents = async (month, year) => {
   return res.data;
 };
 
+// Overlapping interviews and free slots between two ISO datetimes
+export const getInterviewConflicts = async (start, end, minFreeMinutes = 30) => {
+  const res = await axiosClient.get("/jobs/calendar/conflicts", {
+    params: { start, end, min_free_minutes: minFreeMinutes },
+  });
+  return res.data;
+};
+
 // Email API
 export const sendInterviewReminder = async (jobId) => {
   const res = await axiosClient.post("/email/send-reminder", { job_id: jobId });
@@ -45,3 +59,26 @@ export const getUpcomingInterviews = async () => {
   const res = await axiosClient.get("/email/upcoming-interviews");
   return res.data;
 };
+
+// Delta sync: pass the last `version` returned to fetch only what changed
+export const syncJobs = async (since = 0) => {
+  const res = await axiosClient.get("/jobs/sync", { params: { since } });
+  return res.data;
+};
+
+// Resume API
+export const getResumes = async () => {
+  const res = await axiosClient.get("/resumes/");
+  return res.data;
+};
+
+export const saveResume = async (resume) => {
+  const res = await axiosClient.post("/resumes/", resume);
+  return res.data;
+};
+
+// Batch API: { action: "update" | "delete", ids | filter, patch }
+export const batchJobs = async (request) => {
+  const res = await axiosClient.post("/jobs/batch", request);
+  return res.data;
+};
@@ -47,6 +47,12 @@ const Icons = {
       <line x1="10" y1="14" x2="21" y2="3" />
     </svg>
   ),
+  Restore: () => (
+    <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2" width="14" height="14">
+      <polyline points="1 4 1 10 7 10" />
+      <path d="M3.51 15a9 9 0 1 0 2.13-9.36L1 10" />
+    </svg>
+  ),
   FileText: () => (
     <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2">
       <path d="M14 2H6a2 2 0 0 0-2 2v16a2 2 0 0 0 2 2h12a2 2 0 0 0 2-2V8z" />
@@ -65,7 +71,7 @@ const StatusTag = ({ status }) => (
   </span>
 );
 
-const JobCard = ({ job, onClick, onStatusChange, onDelete }) => {
+const JobCard = ({ job, onClick, onStatusChange, onDelete, onRestore }) => {
   // Get company initials for avatar
   const getInitials = (name) => {
     return name
@@ -98,6 +104,12 @@ const JobCard = ({ job, onClick, onStatusChange, onDelete }) => {
     onDelete();
   };
 
+  // Handle restore click
+  const handleRestoreClick = (e) => {
+    e.stopPropagation();
+    onRestore();
+  };
+
   // Handle link click
   const handleLinkClick = (e) => {
     e.stopPropagation();
@@ -105,7 +117,7 @@ const JobCard = ({ job, onClick, onStatusChange, onDelete }) => {
   };
 
   return (
-    <div className={`job-card ${job.status}`} onClick={onClick}>
+    <div className={`job-card ${job.status}${job.archived ? " archived" : ""}`} onClick={onClick}>
       {/* Header */}
       <div className="job-card-header">
         <div className="job-company">
@@ -115,7 +127,7 @@ const JobCard = ({ job, onClick, onStatusChange, onDelete }) => {
             <span>{job.platform}</span>
           </div>
         </div>
-        <StatusTag status={job.status} />
+        {job.archived ? <span className="status-tag archived">Archived</span> : <StatusTag status={job.status} />}
       </div>
 
       {/* Body */}
@@ -152,18 +164,25 @@ const JobCard = ({ job, onClick, onStatusChange, onDelete }) => {
 
       {/* Footer */}
       <div className="job-card-footer">
-        <select
-          className="filter-select"
-          value={job.status}
-          onChange={handleStatusChange}
-          onClick={(e) => e.stopPropagation()}
-          style={{ minWidth: "110px", padding: "0.35rem 0.5rem", fontSize: "0.8125rem" }}
-        >
-          <option value="applied">Applied</option>
-          <option value="interview">Interview</option>
-          <option value="offer">Offer</option>
-          <option value="rejected">Rejected</option>
-        </select>
+        {job.archived ? (
+          <button className="btn btn-secondary btn-sm" onClick={handleRestoreClick} title="Move back to active applications">
+            <Icons.Restore />
+            <span>Restore</span>
+          </button>
+        ) : (
+          <select
+            className="filter-select"
+            value={job.status}
+            onChange={handleStatusChange}
+            onClick={(e) => e.stopPropagation()}
+            style={{ minWidth: "110px", padding: "0.35rem 0.5rem", fontSize: "0.8125rem" }}
+          >
+            <option value="applied">Applied</option>
+            <option value="interview">Interview</option>
+            <option value="offer">Offer</option>
+            <option value="rejected">Rejected</option>
+          </select>
+        )}
 
         <div className="job-actions">
           <button
@@ -173,14 +192,16 @@ const JobCard = ({ job, onClick, onStatusChange, onDelete }) => {
           >
             <Icons.ExternalLink />
           </button>
-          <button
-            className="btn btn-ghost btn-icon btn-sm"
-            onClick={handleDeleteClick}
-            title="Delete application"
-            style={{ color: "var(--color-rejected)" }}
-          >
-            <Icons.Trash />
-          </button>
+          {!job.archived && (
+            <button
+              className="btn btn-ghost btn-icon btn-sm"
+              onClick={handleDeleteClick}
+              title="Delete application"
+              style={{ color: "var(--color-rejected)" }}
+            >
+              <Icons.Trash />
+            </button>
+          )}
         </div>
       </div>
     </div>
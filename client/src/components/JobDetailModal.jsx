@@ -75,6 +75,7 @@ const JobDetailModal = ({ job, onClose, onUpdate, onDelete }) => {
   const [editedResumeVersion, setEditedResumeVersion] = useState(job.resume_version || "");
   const [interviewDate, setInterviewDate] = useState(job.interview_date ? new Date(job.interview_date).toISOString().slice(0, 16) : "");
   const [interviewType, setInterviewType] = useState(job.interview_type || "");
+  const [interviewDuration, setInterviewDuration] = useState(job.interview_duration_minutes || "");
   const [interviewNotes, setInterviewNotes] = useState(job.interview_notes || "");
   const [sendingReminder, setSendingReminder] = useState(false);
 
@@ -121,6 +122,7 @@ const JobDetailModal = ({ job, onClose, onUpdate, onDelete }) => {
     await onUpdate(job.id, {
       interview_date: interviewDate ? new Date(interviewDate).toISOString() : null,
       interview_type: interviewType || null,
+      interview_duration_minutes: interviewDuration ? Number(interviewDuration) : null,
       interview_notes: interviewNotes || null,
     });
     setIsEditingInterview(false);
@@ -295,6 +297,18 @@ const JobDetailModal = ({ job, onClose, onUpdate, onDelete }) => {
                     <option value="Final">Final Round</option>
                   </select>
                 </div>
+                <div className="form-group">
+                  <label className="form-label">Duration (minutes)</label>
+                  <input
+                    type="number"
+                    className="form-input"
+                    min="1"
+                    max="1440"
+                    placeholder="60"
+                    value={interviewDuration}
+                    onChange={(e) => setInterviewDuration(e.target.value)}
+                  />
+                </div>
                 <div className="form-group">
                   <label className="form-label">Interview Notes</label>
                   <textarea
@@ -312,6 +326,7 @@ const JobDetailModal = ({ job, onClose, onUpdate, onDelete }) => {
                       setIsEditingInterview(false);
                       setInterviewDate(job.interview_date ? new Date(job.interview_date).toISOString().slice(0, 16) : "");
                       setInterviewType(job.interview_type || "");
+                      setInterviewDuration(job.interview_duration_minutes || "");
                       setInterviewNotes(job.interview_notes || "");
                     }}
                   >
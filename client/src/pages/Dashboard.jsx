@@ -4,7 +4,7 @@
  * Displays stats, job cards, and handles different views
  */
 import { useEffect, useState, useCallback } from "react";
-import { createJob, getJobs, getStats, updateJob, deleteJob } from "../api/jobsApi";
+import { createJob, getJobs, getStats, updateJob, deleteJob, restoreJob } from "../api/jobsApi";
 import StatsCards from "../components/StatsCards";
 import JobCard from "../components/JobCard";
 import JobModal from "../components/JobModal";
@@ -42,12 +42,14 @@ const Dashboard = ({ currentView, onNavigate }) => {
   const [searchQuery, setSearchQuery] = useState("");
   const [statusFilter, setStatusFilter] = useState("");
   const [platformFilter, setPlatformFilter] = useState("");
+  const [showArchived, setShowArchived] = useState(false);
 
   // Load data from API
   const loadData = useCallback(async () => {
     setLoading(true);
     try {
-      const [jobsRes, statsRes] = await Promise.all([getJobs(), getStats()]);
+      const params = showArchived ? { include_archived: true } : {};
+      const [jobsRes, statsRes] = await Promise.all([getJobs(params), getStats(params)]);
       setJobs(jobsRes);
       setStats(statsRes);
     } catch (error) {
@@ -55,7 +57,7 @@ const Dashboard = ({ currentView, onNavigate }) => {
     } finally {
       setLoading(false);
     }
-  }, []);
+  }, [showArchived]);
 
   // Initial data load
   useEffect(() => {
@@ -109,6 +111,16 @@ const Dashboard = ({ currentView, onNavigate }) => {
     }
   };
 
+  // Handle restoring an archived job
+  const handleRestore = async (id) => {
+    try {
+      await restoreJob(id);
+      await loadData();
+    } catch (error) {
+      console.error("Failed to restore job:", error);
+    }
+  };
+
   // Filter jobs based on search and filters
   const filteredJobs = jobs.filter((job) => {
     const matchesSearch =
@@ -257,6 +269,14 @@ const Dashboard = ({ currentView, onNavigate }) => {
             <option value="Company">Company Website</option>
             <option value="Other">Other</option>
           </select>
+          <label className="filter-toggle">
+            <input
+              type="checkbox"
+              checked={showArchived}
+              onChange={(e) => setShowArchived(e.target.checked)}
+            />
+            Show archived
+          </label>
         </div>
 
         {/* Jobs Grid or Empty State */}
@@ -270,9 +290,10 @@ const Dashboard = ({ currentView, onNavigate }) => {
               <JobCard
                 key={job.id}
                 job={job}
-                onClick={() => setSelectedJob(job)}
+                onClick={() => !job.archived && setSelectedJob(job)}
                 onStatusChange={(status) => handleUpdate(job.id, { status })}
                 onDelete={() => handleDelete(job.id)}
+                onRestore={() => handleRestore(job.id)}
               />
             ))}
           </div>
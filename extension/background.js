@@ -0,0 +1,225 @@
+// extension/background.js
+/**
+ * Job Tracker background service worker
+ * Owns the offline capture queue and drains it into the backend in batches
+ */
+
+const API_BASE = "http://localhost:8001";
+
+const QUEUE_KEY = "capture_queue";
+const REJECTED_KEY = "capture_rejected";
+const RETRY_KEY = "capture_retry_attempt";
+const FLUSH_ALARM = "flush-capture-queue";
+const BATCH_SIZE = 25;
+const BASE_DELAY_MINUTES = 0.5;
+const MAX_DELAY_MINUTES = 30;
+
+// Field limits of the backend's JobCreate schema
+const MAX_LENGTHS = {
+  company: 200,
+  role: 200,
+  notes: 5000,
+  resume_version: 100,
+  description: 100000,
+};
+const PLATFORMS = ["LinkedIn", "Indeed", "Glassdoor", "Company", "Other"];
+
+let flushing = null;
+let queueLock = Promise.resolve();
+
+/**
+ * Read the pending captures from local storage
+ */
+async function getQueue() {
+  const result = await chrome.storage.local.get([QUEUE_KEY]);
+  return result[QUEUE_KEY] || [];
+}
+
+/**
+ * Run a read-modify-write of a stored list, one at a time.
+ * Only this worker writes the queue, so captures can't be overwritten.
+ */
+function updateList(key, change) {
+  const run = queueLock.then(async () => {
+    const result = await chrome.storage.local.get([key]);
+    await chrome.storage.local.set({ [key]: change(result[key] || []) });
+  });
+  queueLock = run.catch(() => {});
+  return run;
+}
+
+/**
+ * Fit a capture to the backend schema so one long page title or
+ * description can't get the whole batch rejected
+ */
+function normalizeCapture(job) {
+  const capture = { ...job };
+  for (const [field, max] of Object.entries(MAX_LENGTHS)) {
+    if (typeof capture[field] === "string" && capture[field].length > max) {
+      capture[field] = capture[field].slice(0, max);
+    }
+  }
+  capture.company = capture.company?.trim() || "Unknown Company";
+  capture.role = capture.role?.trim() || "Unknown Role";
+  if (!PLATFORMS.includes(capture.platform)) capture.platform = "Other";
+  return capture;
+}
+
+async function enqueueCapture(job) {
+  await updateList(QUEUE_KEY, (queue) => [...queue, normalizeCapture(job)]);
+}
+
+/**
+ * Remove flushed captures from the queue by idempotency key
+ */
+async function removeFromQueue(keys) {
+  const done = new Set(keys);
+  await updateList(QUEUE_KEY, (queue) => queue.filter((job) => !done.has(job.idempotency_key)));
+}
+
+/**
+ * Drop captures the server rejected and keep them for the popup to report
+ */
+async function rejectCaptures(jobs) {
+  await removeFromQueue(jobs.map((job) => job.idempotency_key));
+  await updateList(REJECTED_KEY, (rejected) => [
+    ...rejected,
+    ...jobs.map((job) => ({ company: job.company, role: job.role, job_link: job.job_link })),
+  ]);
+}
+
+/**
+ * Indexes of the batch items named in a 422 validation response
+ */
+async function invalidIndexes(res) {
+  const data = await res.json().catch(() => ({}));
+  const indexes = new Set();
+  for (const error of Array.isArray(data.detail) ? data.detail : []) {
+    const [where, field, index] = error.loc || [];
+    if (where === "body" && field === "jobs" && Number.isInteger(index)) indexes.add(index);
+  }
+  return indexes;
+}
+
+/**
+ * Schedule the next flush attempt with exponential backoff
+ */
+async function scheduleRetry() {
+  const result = await chrome.storage.local.get([RETRY_KEY]);
+  const attempt = (result[RETRY_KEY] || 0) + 1;
+  const delay = Math.min(BASE_DELAY_MINUTES * 2 ** (attempt - 1), MAX_DELAY_MINUTES);
+  await chrome.storage.local.set({ [RETRY_KEY]: attempt });
+  chrome.alarms.create(FLUSH_ALARM, { delayInMinutes: delay });
+}
+
+async function resetRetry() {
+  await chrome.storage.local.remove([RETRY_KEY]);
+  chrome.alarms.clear(FLUSH_ALARM);
+}
+
+/**
+ * Send queued captures to /jobs/bulk until the queue is empty.
+ * Returns { sent, pending, rejected, error }.
+ */
+async function flushQueue() {
+  const { access_token: token } = await chrome.storage.sync.get(["access_token"]);
+  let sent = 0;
+  let rejected = 0;
+
+  while (true) {
+    const queue = await getQueue();
+    if (queue.length === 0) {
+      await resetRetry();
+      return { sent, pending: 0, rejected, error: null };
+    }
+    if (!token) {
+      return { sent, pending: queue.length, rejected, error: "Please login first" };
+    }
+
+    const batch = queue.slice(0, BATCH_SIZE);
+    let res;
+    try {
+      res = await fetch(`${API_BASE}/jobs/bulk`, {
+        method: "POST",
+        headers: {
+          "Content-Type": "application/json",
+          Authorization: `Bearer ${token}`,
+        },
+        body: JSON.stringify({ jobs: batch }),
+      });
+    } catch (e) {
+      await scheduleRetry();
+      return { sent, pending: queue.length, rejected, error: "Offline - will retry automatically" };
+    }
+
+    if (res.status === 401) {
+      // Keep the queue; it is flushed again after the next login
+      return { sent, pending: queue.length, rejected, error: "Session expired - please login again" };
+    }
+    if (res.status === 422) {
+      // Drop only the captures the server named; the rest are sent again
+      const indexes = await invalidIndexes(res);
+      const invalid = batch.filter((_, i) => indexes.has(i));
+      if (invalid.length > 0) {
+        await rejectCaptures(invalid);
+        rejected += invalid.length;
+        continue;
+      }
+    }
+    if (!res.ok) {
+      await scheduleRetry();
+      return { sent, pending: queue.length, rejected, error: "Server error - will retry automatically" };
+    }
+
+    const data = await res.json();
+    const saved = data.results.map((r) => r.idempotency_key);
+    await removeFromQueue(saved);
+    sent += saved.length;
+
+    if (saved.length === 0) {
+      await scheduleRetry();
+      return { sent, pending: queue.length, rejected, error: "Server error - will retry automatically" };
+    }
+  }
+}
+
+/**
+ * Run at most one flush at a time
+ */
+function flushOnce() {
+  if (!flushing) {
+    flushing = flushQueue().finally(() => {
+      flushing = null;
+    });
+  }
+  return flushing;
+}
+
+chrome.runtime.onMessage.addListener((request, sender, sendResponse) => {
+  if (request.type === "FLUSH_QUEUE") {
+    // Captures from the popup are queued here, so only this worker writes the queue
+    const queued = request.job ? enqueueCapture(request.job) : Promise.resolve();
+    queued.then(flushOnce).then(sendResponse);
+    return true; // keep the channel open for the async response
+  }
+  if (request.type === "TAKE_REJECTED") {
+    let taken = [];
+    updateList(REJECTED_KEY, (rejected) => {
+      taken = rejected;
+      return [];
+    }).then(() => sendResponse(taken));
+    return true;
+  }
+});
+
+chrome.alarms.onAlarm.addListener((alarm) => {
+  if (alarm.name === FLUSH_ALARM) flushOnce();
+});
+
+chrome.runtime.onStartup.addListener(() => flushOnce());
+chrome.runtime.onInstalled.addListener(() => flushOnce());
+
+// Flush as soon as a new login token is stored
+chrome.storage.onChanged.addListener((changes, area) => {
+  if (area === "sync" && changes.access_token?.newValue) flushOnce();
+});
@@ -82,6 +82,41 @@ async function clearToken() {
   });
 }
 
+/**
+ * Hand a capture to the background worker, which owns the offline queue,
+ * and have it flush the queue now
+ */
+async function queueAndFlush(jobPayload) {
+  return new Promise((resolve) => {
+    chrome.runtime.sendMessage({ type: "FLUSH_QUEUE", job: jobPayload }, (result) => {
+      resolve(chrome.runtime.lastError ? null : result);
+    });
+  });
+}
+
+/**
+ * Fetch (and clear) captures the server rejected since the last check
+ */
+async function takeRejected() {
+  return new Promise((resolve) => {
+    chrome.runtime.sendMessage({ type: "TAKE_REJECTED" }, (result) => {
+      resolve(chrome.runtime.lastError ? [] : result || []);
+    });
+  });
+}
+
+/**
+ * Tell the user about captures that could not be saved
+ */
+async function showRejected() {
+  const rejected = await takeRejected();
+  if (rejected.length === 0) return false;
+  const names = rejected.map((job) => `${job.company} - ${job.role}`).join(", ");
+  saveStatus.textContent = `Could not save ${rejected.length} capture(s): ${names}`;
+  saveStatus.className = "status-error";
+  return true;
+}
+
 // Login button handler
 loginBtn.addEventListener("click", async () => {
   const email = emailInput.value.trim();
@@ -165,7 +200,11 @@ saveJobBtn.addEventListener("click", async () => {
         status: "applied",
         platform: platform,
         notes: response.description ? `Auto-captured: ${response.description.slice(0, 200)}...` : "",
+        // Full text is stored server-side and shared between users saving the same posting
+        description: response.description || "",
         source: "extension",
+        // Lets the server ignore retries of a capture it already saved
+        idempotency_key: crypto.randomUUID(),
       };
 
       jobPreview.innerHTML = `
@@ -173,34 +212,25 @@ saveJobBtn.addEventListener("click", async () => {
         <span>${jobPayload.role}</span>
       `;
 
-      try {
-        // Note: Use /jobs/ with trailing slash to match FastAPI route
-        const res = await fetch(`${API_BASE}/jobs/`, {
-          method: "POST",
-          headers: {
-            "Content-Type": "application/json",
-            Authorization: `Bearer ${token}`,
-          },
-          body: JSON.stringify(jobPayload),
-        });
-
-        if (!res.ok) {
-          const errorData = await res.json().catch(() => ({}));
-          saveStatus.textContent = errorData.detail || "Failed to save job";
-          saveStatus.className = "status-error";
-          return;
-        }
+      // The worker persists it before sending, so it survives network errors and popup close
+      const result = await queueAndFlush(jobPayload);
+      if (!result) {
+        saveStatus.textContent = "Could not queue job - please try again";
+        saveStatus.className = "status-error";
+        return;
+      }
+      if (await showRejected()) return;
+
+      // Show success animation
+      saveJobBtn.classList.add("success");
+      setTimeout(() => saveJobBtn.classList.remove("success"), 1500);
 
+      if (!result.error) {
         saveStatus.textContent = "Job saved successfully!";
         saveStatus.className = "status-success";
-
-        // Show success animation
-        saveJobBtn.classList.add("success");
-        setTimeout(() => saveJobBtn.classList.remove("success"), 1500);
-
-      } catch (e) {
-        saveStatus.textContent = "Network error - check server connection";
-        saveStatus.className = "status-error";
+      } else {
+        saveStatus.textContent = `Job queued. ${result.error}`;
+        saveStatus.className = "status-info";
       }
     });
   });
@@ -210,6 +240,7 @@ saveJobBtn.addEventListener("click", async () => {
 getToken().then(({ token, email }) => {
   if (token) {
     setLoggedInUI(email);
+    showRejected();
   } else {
     setLoggedOutUI();
   }
@@ -0,0 +1,170 @@
+# server/app/archive.py
+"""
+Hot/cold tiering for job applications.
+
+Old rejected jobs and stale "applied" jobs are moved out of the hot
+jobs collection into a compact archive collection. Archived documents
+keep only the fields needed to filter them, plus the full original
+document as a zlib-compressed BSON payload.
+"""
+import asyncio
+import zlib
+from datetime import datetime, timedelta
+from typing import Optional
+
+import bson
+from bson.binary import Binary
+from pymongo.errors import BulkWriteError
+
+from .cache import cache
+from .config import settings
+from .models import JOBS_COLLECTION, ARCHIVED_JOBS_COLLECTION
+from .sync import reserve_versions, add_tombstones, clear_tombstone
+
+# Background archiver task (started from main.py on startup)
+_archiver_task: Optional[asyncio.Task] = None
+
+
+def archive_rules(now: datetime) -> list[dict]:
+    """Return the Mongo filters that select jobs eligible for archival."""
+    return [
+        {
+            "status": "rejected",
+            "updated_at": {"$lt": now - timedelta(days=settings.archive_rejected_after_days)},
+        },
+        {
+            "status": "applied",
+            "updated_at": {"$lt": now - timedelta(days=settings.archive_applied_after_days)},
+        },
+    ]
+
+
+def compress_job(doc: dict, archived_at: datetime) -> dict:
+    """Build the compact archive document for a hot job document."""
+    return {
+        "_id": doc["_id"],
+        "user_id": doc["user_id"],
+        "company": doc["company"],
+        "status": doc["status"],
+        "platform": doc["platform"],
+        "created_at": doc["created_at"],
+        "fit_score": doc.get("fit_score"),
+        "description_hash": doc.get("description_hash"),
+        "archived_at": archived_at,
+        "payload": Binary(zlib.compress(bson.encode(doc))),
+    }
+
+
+def decompress_job(archived: dict) -> dict:
+    """Return the original job document stored in an archive document."""
+    return bson.decode(zlib.decompress(archived["payload"]))
+
+
+async def archive_batch(db, query: dict, limit: int) -> int:
+    """
+    Move up to `limit` jobs matching `query` into the archive.
+
+    Documents are copied first and only then removed from the hot
+    collection with the same filter, so a job updated in between stays
+    hot and its archive copy is dropped again.
+
+    Returns the number of jobs archived.
+    """
+    docs = await db[JOBS_COLLECTION].find(query).limit(limit).to_list(limit)
+    if not docs:
+        return 0
+
+    now = datetime.utcnow()
+    ids = [doc["_id"] for doc in docs]
+    try:
+        await db[ARCHIVED_JOBS_COLLECTION].insert_many(
+            [compress_job(doc, now) for doc in docs], ordered=False
+        )
+    except BulkWriteError:
+        # Leftovers from an interrupted run; the hot copy wins below
+        await db[ARCHIVED_JOBS_COLLECTION].delete_many({"_id": {"$in": ids}})
+        await db[ARCHIVED_JOBS_COLLECTION].insert_many(
+            [compress_job(doc, now) for doc in docs], ordered=False
+        )
+
+    result = await db[JOBS_COLLECTION].delete_many({**query, "_id": {"$in": ids}})
+
+    still_hot: set = set()
+    if result.deleted_count < len(ids):
+        still_hot = set(await db[JOBS_COLLECTION].distinct("_id", {"_id": {"$in": ids}}))
+        if still_hot:
+            await db[ARCHIVED_JOBS_COLLECTION].delete_many({"_id": {"$in": list(still_hot)}})
+
+    # Archived jobs leave the hot set, so sync clients see them as removed
+    archived_by_user: dict[str, list[str]] = {}
+    for doc in docs:
+        if doc["_id"] not in still_hot:
+            archived_by_user.setdefault(doc["user_id"], []).append(doc["_id"])
+    for user_id, job_ids in archived_by_user.items():
+        await add_tombstones(db, user_id, job_ids, reason="archived")
+        await cache.invalidate_user(user_id)
+
+    return result.deleted_count
+
+
+async def archive_stale_jobs(db, now: Optional[datetime] = None) -> int:
+    """
+    Archive every job matching the archival rules.
+
+    Work is done in batches of `archive_batch_size` with a pause between
+    batches so the archiver doesn't compete with live traffic.
+    """
+    now = now or datetime.utcnow()
+    total = 0
+    for rule in archive_rules(now):
+        while True:
+            moved = await archive_batch(db, rule, settings.archive_batch_size)
+            total += moved
+            if moved < settings.archive_batch_size:
+                break
+            await asyncio.sleep(settings.archive_batch_pause_seconds)
+    return total
+
+
+async def restore_job(db, job_id: str, user_id: str) -> Optional[dict]:
+    """Move an archived job back into the hot collection. Returns the job or None."""
+    archived = await db[ARCHIVED_JOBS_COLLECTION].find_one(
+        {"_id": job_id, "user_id": user_id}
+    )
+    if not archived:
+        return None
+
+    doc = decompress_job(archived)
+    doc["updated_at"] = datetime.utcnow()
+    async with reserve_versions(db, user_id) as version:
+        doc["version"] = version
+        await db[JOBS_COLLECTION].replace_one({"_id": doc["_id"]}, doc, upsert=True)
+    await db[ARCHIVED_JOBS_COLLECTION].delete_one({"_id": job_id})
+    await clear_tombstone(db, job_id)
+    await cache.invalidate_user(user_id)
+    return doc
+
+
+async def _run_archiver(db):
+    while True:
+        try:
+            moved = await archive_stale_jobs(db)
+            if moved:
+                print(f"Archived {moved} stale jobs")
+        except Exception as e:
+            print(f"Archiver error: {e}")
+        await asyncio.sleep(settings.archive_interval_seconds)
+
+
+def start_archiver(db):
+    """Start the periodic background archiver if enabled."""
+    global _archiver_task
+    if settings.archive_enabled and _archiver_task is None:
+        _archiver_task = asyncio.create_task(_run_archiver(db))
+
+
+def stop_archiver():
+    global _archiver_task
+    if _archiver_task is not None:
+        _archiver_task.cancel()
+        _archiver_task = None
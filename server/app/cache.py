@@ -0,0 +1,224 @@
+# server/app/cache.py
+"""
+Two-level cache shared by all API nodes (CACHE_BACKEND=memory|redis).
+
+L1 is a small in-process LRU; L2 is a shared backend: Redis for
+multi-node deployments (`pip install redis`), or an in-memory stand-in
+for single-node runs and tests. A fakeredis client can also be passed
+to RedisBackend.
+
+Per-user entries live under a generation number kept in L2:
+`u:<user_id>:g<gen>:<name>`. Job mutations bump the generation once,
+which invalidates every cached view of that user's jobs on every node
+without deleting keys; old entries simply expire. Reading the generation
+costs one small L2 lookup per request, so an L1 hit still sees writes
+made on other nodes.
+
+Concurrent misses for the same key on one node share a single load
+(single-flight), and hits/misses are counted per layer.
+"""
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional
+
+from fastapi.encoders import jsonable_encoder
+
+from .config import settings
+
+
+class _LeaderCancelled(Exception):
+    """Set on a single-flight future whose loading task was cancelled."""
+
+
+class MemoryBackend:
+    """In-process stand-in for Redis, with per-key expiry."""
+
+    def __init__(self):
+        self.data: dict[str, tuple[bytes, Optional[float]]] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        item = self.data.get(key)
+        if item is None:
+            return None
+        value, expires = item
+        if expires is not None and expires < time.monotonic():
+            del self.data[key]
+            return None
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: int):
+        self.data[key] = (value, time.monotonic() + ttl)
+
+    async def incr(self, key: str) -> int:
+        value = int((await self.get(key)) or 0) + 1
+        self.data[key] = (str(value).encode(), None)
+        return value
+
+
+class RedisBackend:
+    """Shared L2 on Redis (redis.asyncio or fakeredis.aioredis client)."""
+
+    def __init__(self, client):
+        self.client = client
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.client.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: int):
+        await self.client.set(key, value, ex=ttl)
+
+    async def incr(self, key: str) -> int:
+        return await self.client.incr(key)
+
+
+class TwoLevelCache:
+    """L1 LRU in front of an L2 backend; a no-op pass-through when backend is None."""
+
+    def __init__(self, backend, l1_max_entries: int, ttl: int):
+        self.backend = backend
+        self.l1: "OrderedDict[str, tuple[Any, float]]" = OrderedDict()
+        self.l1_max_entries = l1_max_entries
+        self.ttl = ttl
+        self.inflight: dict[str, asyncio.Future] = {}
+        self.metrics = {"l1_hits": 0, "l1_misses": 0, "l2_hits": 0, "l2_misses": 0, "loads": 0, "errors": 0}
+
+    # -- L1 ------------------------------------------------------------------
+
+    def _l1_get(self, key: str):
+        item = self.l1.get(key)
+        if item is None or item[1] < time.monotonic():
+            self.l1.pop(key, None)
+            return None
+        self.l1.move_to_end(key)
+        return item
+
+    def _l1_set(self, key: str, value: Any, ttl: int):
+        self.l1[key] = (value, time.monotonic() + ttl)
+        self.l1.move_to_end(key)
+        while len(self.l1) > self.l1_max_entries:
+            self.l1.popitem(last=False)
+
+    # -- public API ----------------------------------------------------------
+
+    async def get_or_load(
+        self, key: str, loader: Callable[[], Awaitable[Any]], ttl: Optional[int] = None
+    ) -> Any:
+        """
+        Return the cached value for `key`, loading and storing it on a miss.
+
+        Values must be JSON-serializable (they are passed through
+        jsonable_encoder). L2 errors fall back to the loader.
+        """
+        if self.backend is None:
+            return await loader()
+
+        ttl = ttl or self.ttl
+        while True:
+            item = self._l1_get(key)
+            if item is not None:
+                self.metrics["l1_hits"] += 1
+                return item[0]
+            self.metrics["l1_misses"] += 1
+
+            if key not in self.inflight:
+                return await self._lead(key, loader, ttl)
+            try:
+                return await asyncio.shield(self.inflight[key])
+            except _LeaderCancelled:
+                # The first waiter to wake up takes over the load
+                continue
+
+    async def _lead(self, key: str, loader, ttl: int) -> Any:
+        future = asyncio.get_running_loop().create_future()
+        self.inflight[key] = future
+        try:
+            value = await self._load(key, loader, ttl)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            # Only this request was cancelled; waiters retry instead
+            future.set_exception(_LeaderCancelled())
+            future.exception()  # Mark retrieved when nobody else is waiting
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        finally:
+            del self.inflight[key]
+
+    async def _load(self, key: str, loader, ttl: int) -> Any:
+        try:
+            raw = await self.backend.get(key)
+        except Exception as e:
+            self.metrics["errors"] += 1
+            print(f"Cache L2 error: {e}")
+            raw = None
+        if raw is not None:
+            self.metrics["l2_hits"] += 1
+            value = json.loads(raw)
+            self._l1_set(key, value, ttl)
+            return value
+        self.metrics["l2_misses"] += 1
+
+        self.metrics["loads"] += 1
+        value = jsonable_encoder(await loader())
+        self._l1_set(key, value, ttl)
+        try:
+            await self.backend.set(key, json.dumps(value).encode(), ttl)
+        except Exception as e:
+            self.metrics["errors"] += 1
+            print(f"Cache L2 error: {e}")
+        return value
+
+    async def user_key(self, user_id: str, name: str) -> str:
+        """Versioned key for a per-user entry."""
+        if self.backend is None:
+            return ""
+        try:
+            generation = int(await self.backend.get(f"u:{user_id}:gen") or 0)
+        except Exception as e:
+            self.metrics["errors"] += 1
+            print(f"Cache L2 error: {e}")
+            # Without the generation we can't tell stale entries apart
+            return f"u:{user_id}:nocache:{time.monotonic_ns()}:{name}"
+        return f"u:{user_id}:g{generation}:{name}"
+
+    async def get_user_cached(
+        self, user_id: str, name: str, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """get_or_load for an entry derived from the user's jobs."""
+        return await self.get_or_load(await self.user_key(user_id, name), loader)
+
+    async def invalidate_user(self, user_id: str):
+        """Invalidate every cached view of a user's jobs, on all nodes."""
+        if self.backend is None:
+            return
+        try:
+            await self.backend.incr(f"u:{user_id}:gen")
+        except Exception as e:
+            self.metrics["errors"] += 1
+            print(f"Cache L2 error: {e}")
+
+    def info(self) -> dict:
+        return {
+            "backend": type(self.backend).__name__ if self.backend is not None else None,
+            "l1_entries": len(self.l1),
+            "inflight": len(self.inflight),
+            **self.metrics,
+        }
+
+
+def build_backend():
+    if settings.cache_backend == "redis":
+        import redis.asyncio as redis  # Optional dependency, only needed for this backend
+
+        return RedisBackend(redis.from_url(settings.redis_url))
+    if settings.cache_backend == "memory":
+        return MemoryBackend()
+    return None
+
+
+cache = TwoLevelCache(build_backend(), settings.cache_l1_max_entries, settings.cache_ttl_seconds)
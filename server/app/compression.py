@@ -0,0 +1,164 @@
+# server/app/compression.py
+"""
+Negotiated response compression (zstd, brotli, gzip).
+
+Large JSON responses such as job lists and calendar events are very
+repetitive, so they are compressed when the client accepts it and the
+body is above a size threshold. Levels favour latency over ratio.
+
+Compressed bytes are kept in a small LRU keyed by a digest of the
+uncompressed body, so a hot payload is compressed once instead of on
+every request.
+"""
+import gzip
+import hashlib
+from collections import OrderedDict
+from typing import Optional
+
+import zstandard
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; zstd and gzip are always available
+    brotli = None
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .config import settings
+
+COMPRESSIBLE_TYPES = ("application/json", "text/")
+
+
+def _zstd(body: bytes) -> bytes:
+    return zstandard.ZstdCompressor(level=3).compress(body)
+
+
+def _brotli(body: bytes) -> bytes:
+    return brotli.compress(body, quality=4)
+
+
+def _gzip(body: bytes) -> bytes:
+    return gzip.compress(body, compresslevel=5, mtime=0)
+
+
+# Server preference order
+ENCODERS = {"zstd": _zstd}
+if brotli is not None:
+    ENCODERS["br"] = _brotli
+ENCODERS["gzip"] = _gzip
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick the preferred encoding the client accepts (q > 0), if any."""
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip().lower()] = q
+
+    wildcard = accepted.get("*", 0.0)
+    for encoding in ENCODERS:
+        if accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+
+class CompressedCache:
+    """LRU of compressed bodies keyed by (encoding, body digest), bounded in bytes."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.entries: "OrderedDict[tuple[str, bytes], bytes]" = OrderedDict()
+
+    def get(self, key: tuple[str, bytes]) -> Optional[bytes]:
+        value = self.entries.get(key)
+        if value is not None:
+            self.entries.move_to_end(key)
+        return value
+
+    def put(self, key: tuple[str, bytes], value: bytes):
+        if len(value) > self.max_bytes:
+            return
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.size -= len(old)
+        self.entries[key] = value
+        self.size += len(value)
+        while self.size > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.size -= len(evicted)
+
+
+compressed_cache = CompressedCache(settings.compression_cache_max_bytes)
+
+
+def compress_body(body: bytes, encoding: str) -> bytes:
+    """Compress a body, reusing the cached result for identical bodies."""
+    key = (encoding, hashlib.blake2b(body, digest_size=16).digest())
+    compressed = compressed_cache.get(key)
+    if compressed is None:
+        compressed = ENCODERS[encoding](body)
+        compressed_cache.put(key, compressed)
+    return compressed
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing single-chunk text/JSON responses."""
+
+    def __init__(self, app: ASGIApp, min_size: int = 1024):
+        self.app = app
+        self.min_size = min_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        passthrough = False
+
+        async def send_wrapper(message: Message):
+            nonlocal start, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            headers = MutableHeaders(raw=start["headers"])
+            body = message.get("body", b"")
+            compressible = (
+                not message.get("more_body", False)
+                and len(body) >= self.min_size
+                and "content-encoding" not in headers
+                and headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+            )
+            if not compressible:
+                # Streaming or small responses are sent as-is
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+
+            compressed = compress_body(body, encoding)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            await send(start)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
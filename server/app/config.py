@@ -13,6 +13,70 @@ class Settings(BaseSettings):
     email_from: str
     email_password: str
 
+    # Archival of stale applications (see app/archive.py)
+    archive_enabled: bool = False
+    archive_rejected_after_days: int = 30
+    archive_applied_after_days: int = 90
+    archive_batch_size: int = 100
+    archive_batch_pause_seconds: float = 1.0
+    archive_interval_seconds: int = 3600
+
+    # Cleanup of job descriptions no job references (see app/descriptions.py)
+    description_sweep_enabled: bool = True
+    description_sweep_grace_seconds: int = 3600
+    description_sweep_batch_size: int = 500
+    description_sweep_pause_seconds: float = 0.2
+    description_sweep_interval_seconds: int = 6 * 3600
+
+    # Background rescoring of jobs when a resume changes (see app/scoring.py)
+    rescore_batch_size: int = 200
+    rescore_batch_pause_seconds: float = 0.2
+
+    # Resume uploads (see app/extraction.py)
+    upload_dir: str = "uploads"
+    max_upload_bytes: int = 10 * 1024 * 1024
+    extraction_workers: int = 2
+    extraction_timeout_seconds: float = 30
+
+    # Response compression (see app/compression.py)
+    compression_enabled: bool = True
+    compression_min_bytes: int = 1024
+    compression_cache_max_bytes: int = 32 * 1024 * 1024
+
+    # Admin endpoints (/admin/*) require this token in X-Admin-Token; disabled when empty
+    admin_token: str = ""
+
+    # Event-loop blocking detector (see app/loop_monitor.py)
+    loop_monitor_enabled: bool = False
+    loop_monitor_threshold_ms: float = 100
+    loop_monitor_interval_ms: float = 50
+    loop_monitor_strict: bool = False
+    loop_monitor_budget_ms: float = 200
+
+    # On-demand request profiling (see app/profiling.py)
+    profiling_enabled: bool = False
+    profile_sample_rate: float = 0.0
+    profile_sample_interval_ms: float = 5
+    profile_max_entries: int = 100
+    profile_max_stacks: int = 500
+
+    # Delta sync: reservations older than this are treated as abandoned
+    sync_reservation_timeout_seconds: int = 60
+
+    # Two-level response cache (see app/cache.py): "none", "memory" or "redis"
+    cache_backend: str = "none"
+    redis_url: str = "redis://localhost:6379/0"
+    cache_ttl_seconds: int = 60
+    cache_l1_max_entries: int = 10000
+
+    # Interview scheduling (see app/interviews.py)
+    default_interview_minutes: int = 60
+    interview_index_max_users: int = 1000
+
+    # In-memory columnar job index (see app/job_index.py, needs numpy)
+    job_index_enabled: bool = False
+    job_index_max_bytes: int = 64 * 1024 * 1024
+
     class Config:
         env_file = ".env"
 
@@ -1,6 +1,10 @@
 # server/app/database.py
 from motor.motor_asyncio import AsyncIOMotorClient
 from .config import settings
+from .profiling import wrap_db
+from .models import (
+    JOBS_COLLECTION, ARCHIVED_JOBS_COLLECTION, JOB_TOMBSTONES_COLLECTION, RESUMES_COLLECTION,
+)
 
 client: AsyncIOMotorClient | None = None
 
@@ -12,4 +16,32 @@ def get_client() -> AsyncIOMotorClient:
 
 def get_db():
     mongo_client = get_client()
-    return mongo_client[settings.mongodb_db_name]
+    # Profiled requests get a wrapper that times Mongo awaits
+    return wrap_db(mongo_client[settings.mongodb_db_name])
+
+
+async def ensure_indexes(db):
+    """Create the indexes the routes and background jobs rely on."""
+    await db[JOBS_COLLECTION].create_index([("user_id", 1), ("created_at", -1)])
+    await db[JOBS_COLLECTION].create_index([("status", 1), ("updated_at", 1)])
+    await db[ARCHIVED_JOBS_COLLECTION].create_index([("user_id", 1), ("created_at", -1)])
+    # Offline captures from the extension are deduplicated per user
+    await db[JOBS_COLLECTION].create_index(
+        [("user_id", 1), ("idempotency_key", 1)],
+        unique=True,
+        partialFilterExpression={"idempotency_key": {"$type": "string"}},
+    )
+    # list_jobs sorted/filtered by precomputed fit score
+    await db[JOBS_COLLECTION].create_index([("user_id", 1), ("fit_score", -1), ("created_at", -1)])
+    await db[RESUMES_COLLECTION].create_index([("user_id", 1), ("name", 1)], unique=True)
+    # At most one default resume per user
+    await db[RESUMES_COLLECTION].create_index(
+        "user_id", unique=True, name="one_default_resume",
+        partialFilterExpression={"is_default": True},
+    )
+    # Delta sync reads only the rows past a client's version
+    await db[JOBS_COLLECTION].create_index([("user_id", 1), ("version", 1)])
+    await db[JOB_TOMBSTONES_COLLECTION].create_index([("user_id", 1), ("version", 1)])
+    # The description sweep looks up which blobs are still referenced
+    await db[JOBS_COLLECTION].create_index("description_hash")
+    await db[ARCHIVED_JOBS_COLLECTION].create_index("description_hash")
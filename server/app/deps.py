@@ -3,11 +3,16 @@
 Dependency injection for FastAPI routes.
 Provides authentication and database access dependencies.
 """
-from fastapi import Depends, HTTPException, status
+import secrets
+
+from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
 
 from .auth import decode_token
+from .cache import cache
+from .config import settings
+from .profiling import profiled
 from .database import get_db
 from .models import USERS_COLLECTION
 from .schemas import TokenData
@@ -16,6 +21,7 @@ from .schemas import TokenData
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 
+@profiled("auth")
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     db=Depends(get_db)
@@ -48,13 +54,28 @@ async def get_current_user(
     except (JWTError, Exception):
         raise credentials_exception
 
-    # Verify user exists in database
-    user = await db[USERS_COLLECTION].find_one({"_id": token_data.user_id})
+    async def load_user():
+        user = await db[USERS_COLLECTION].find_one({"_id": token_data.user_id}, {"email": 1})
+        if user is None:
+            return None
+        # Dict with 'sub' key to match what jobs_routes expects
+        return {"sub": str(user["_id"]), "email": user["email"]}
+
+    # Verify user exists in database (cached across nodes, users are never deleted)
+    user = await cache.get_or_load(f"u:{token_data.user_id}:user", load_user)
     if user is None:
         raise credentials_exception
+    return user
 
-    # Return dict with 'sub' key to match what jobs_routes expects
-    return {
-        "sub": str(user["_id"]),
-        "email": user["email"],
-    }
+
+async def require_admin(x_admin_token: str | None = Header(None)) -> None:
+    """
+    Guards operational endpoints with the ADMIN_TOKEN setting.
+
+    Raises:
+        HTTPException: If admin endpoints are disabled or the token is wrong
+    """
+    if not settings.admin_token or not x_admin_token or not secrets.compare_digest(
+        x_admin_token, settings.admin_token
+    ):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
@@ -0,0 +1,154 @@
+# server/app/descriptions.py
+"""
+Content-addressed store for full job descriptions.
+
+Descriptions are kept out of job documents so list scans stay small.
+Each one is stored once, zstd-compressed and keyed by the SHA-256 of its
+text, so users saving the same posting share a single blob. Jobs only
+keep the `description_hash`; the text is loaded when an endpoint needs it.
+
+Blobs are shared, so deleting or editing a job never deletes one
+directly. A periodic sweep instead removes blobs that no hot or archived
+job references any more. Every store refreshes the blob's `used_at`, and
+the sweep only deletes blobs unused for DESCRIPTION_SWEEP_GRACE_SECONDS,
+so a blob is never removed between being stored and being referenced.
+"""
+import asyncio
+import hashlib
+from datetime import datetime, timedelta
+from typing import Optional
+
+import zstandard
+from bson.binary import Binary
+from pymongo.errors import DuplicateKeyError
+
+from .config import settings
+from .models import DESCRIPTIONS_COLLECTION, JOBS_COLLECTION, ARCHIVED_JOBS_COLLECTION
+
+# Favour speed: descriptions are compressed on the request path
+_COMPRESSION_LEVEL = 3
+
+# Background sweep task (started from main.py on startup)
+_sweeper_task: Optional[asyncio.Task] = None
+
+
+def description_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+async def store_description(db, text: str) -> Optional[str]:
+    """Store a description if it isn't stored yet and return its hash."""
+    text = text.strip()
+    if not text:
+        return None
+
+    content_hash = description_hash(text)
+    now = datetime.utcnow()
+    # Touching an existing blob also keeps the sweep off it until it's referenced
+    result = await db[DESCRIPTIONS_COLLECTION].update_one(
+        {"_id": content_hash}, {"$set": {"used_at": now}}
+    )
+    if result.matched_count:
+        return content_hash
+
+    compressor = zstandard.ZstdCompressor(level=_COMPRESSION_LEVEL)
+    try:
+        await db[DESCRIPTIONS_COLLECTION].insert_one({
+            "_id": content_hash,
+            "data": Binary(compressor.compress(text.encode("utf-8"))),
+            "size": len(text),
+            "created_at": now,
+            "used_at": now,
+        })
+    except DuplicateKeyError:
+        pass  # Saved concurrently by another request
+    return content_hash
+
+
+async def load_descriptions(db, hashes: list[str]) -> dict[str, str]:
+    """Load and decompress several descriptions in one query."""
+    if not hashes:
+        return {}
+    decompressor = zstandard.ZstdDecompressor()
+    return {
+        doc["_id"]: decompressor.decompress(doc["data"]).decode("utf-8")
+        async for doc in db[DESCRIPTIONS_COLLECTION].find({"_id": {"$in": list(set(hashes))}})
+    }
+
+
+async def load_description(db, content_hash: Optional[str]) -> Optional[str]:
+    """Load a single description, or None if the job has none."""
+    if not content_hash:
+        return None
+    return (await load_descriptions(db, [content_hash])).get(content_hash)
+
+
+async def _referenced(db, hashes: list[str]) -> set[str]:
+    query = {"description_hash": {"$in": hashes}}
+    found = set(await db[JOBS_COLLECTION].distinct("description_hash", query))
+    found.update(await db[ARCHIVED_JOBS_COLLECTION].distinct("description_hash", query))
+    rest = [h for h in hashes if h not in found]
+    if rest:
+        # A job restored from the archive between the two reads above is
+        # missing from both; it is hot again by now
+        found.update(await db[JOBS_COLLECTION].distinct("description_hash", {"description_hash": {"$in": rest}}))
+    return found
+
+
+async def sweep_descriptions(db, now: Optional[datetime] = None) -> int:
+    """
+    Delete descriptions no job references, in batches.
+
+    Only blobs unused for the grace period are considered, and the delete
+    re-checks `used_at`, so a blob stored again mid-sweep is kept.
+
+    Returns the number of descriptions deleted.
+    """
+    now = now or datetime.utcnow()
+    cutoff = now - timedelta(seconds=settings.description_sweep_grace_seconds)
+    deleted = 0
+    last_id = ""
+    while True:
+        hashes = [
+            doc["_id"]
+            async for doc in db[DESCRIPTIONS_COLLECTION].find(
+                {"_id": {"$gt": last_id}, "used_at": {"$lt": cutoff}}, {"_id": 1}
+            ).sort("_id", 1).limit(settings.description_sweep_batch_size)
+        ]
+        if not hashes:
+            return deleted
+        last_id = hashes[-1]
+
+        referenced = await _referenced(db, hashes)
+        orphans = [h for h in hashes if h not in referenced]
+        if orphans:
+            result = await db[DESCRIPTIONS_COLLECTION].delete_many(
+                {"_id": {"$in": orphans}, "used_at": {"$lt": cutoff}}
+            )
+            deleted += result.deleted_count
+        await asyncio.sleep(settings.description_sweep_pause_seconds)
+
+
+async def _run_sweeper(db):
+    while True:
+        try:
+            deleted = await sweep_descriptions(db)
+            if deleted:
+                print(f"Deleted {deleted} unused job descriptions")
+        except Exception as e:
+            print(f"Description sweep error: {e}")
+        await asyncio.sleep(settings.description_sweep_interval_seconds)
+
+
+def start_sweeper(db):
+    """Start the periodic description sweep if enabled."""
+    global _sweeper_task
+    if settings.description_sweep_enabled and _sweeper_task is None:
+        _sweeper_task = asyncio.create_task(_run_sweeper(db))
+
+
+def stop_sweeper():
+    global _sweeper_task
+    if _sweeper_task is not None:
+        _sweeper_task.cancel()
+        _sweeper_task = None
@@ -0,0 +1,239 @@
+# server/app/extraction.py
+"""
+Resume file uploads and text extraction.
+
+UploadSizeLimitMiddleware rejects an upload larger than MAX_UPLOAD_BYTES
+from its Content-Length, or as soon as that much body has arrived, before
+Starlette spools the multipart body. The spooled file is then copied in
+chunks to a temporary file in the upload directory (a second write that
+the worker processes need for a path) while being hashed, so the file is
+never held in memory whole. Text extraction (PDF/DOCX
+parsing) is CPU-bound and runs in a bounded process pool, never on the
+event loop. A worker that crashes or exceeds EXTRACTION_TIMEOUT_SECONDS
+gets the pool replaced. Extracted text is cached by content hash, so
+re-uploading the same file skips extraction entirely; the file itself is
+deleted once its text is known.
+"""
+import asyncio
+import hashlib
+import os
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from typing import Optional
+from xml.etree import ElementTree
+
+from fastapi import HTTPException, UploadFile
+from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .config import settings
+from .models import RESUME_TEXTS_COLLECTION
+
+SUPPORTED_EXTENSIONS = {".pdf", ".docx"}
+CHUNK_SIZE = 1024 * 1024
+# Room for the multipart boundaries and form fields around the file
+MULTIPART_OVERHEAD = 64 * 1024
+
+_WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_slots: Optional[asyncio.Semaphore] = None
+
+
+# =============================================================================
+# Extraction (runs in worker processes)
+# =============================================================================
+
+def _extract_pdf(path: str) -> str:
+    from pypdf import PdfReader
+
+    reader = PdfReader(path)
+    return "\n".join(page.extract_text() or "" for page in reader.pages)
+
+
+def _extract_docx(path: str) -> str:
+    with zipfile.ZipFile(path) as archive:
+        xml = archive.read("word/document.xml")
+    root = ElementTree.fromstring(xml)
+    paragraphs = []
+    for paragraph in root.iter(f"{_WORD_NS}p"):
+        paragraphs.append("".join(node.text or "" for node in paragraph.iter(f"{_WORD_NS}t")))
+    return "\n".join(paragraphs)
+
+
+def extract_text(path: str, extension: str) -> str:
+    """Extract plain text from a PDF or DOCX file."""
+    if extension == ".pdf":
+        return _extract_pdf(path)
+    if extension == ".docx":
+        return _extract_docx(path)
+    raise ValueError(f"Unsupported file type: {extension}")
+
+
+# =============================================================================
+# Async helpers (run on the event loop)
+# =============================================================================
+
+def _get_pool() -> tuple[ProcessPoolExecutor, asyncio.Semaphore]:
+    global _pool, _pool_slots
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=settings.extraction_workers)
+    if _pool_slots is None:
+        # Bound queued work so a burst of uploads can't pile up unbounded
+        _pool_slots = asyncio.Semaphore(settings.extraction_workers * 2)
+    return _pool, _pool_slots
+
+
+def _replace_pool(pool: ProcessPoolExecutor):
+    """Drop a broken or stuck pool; the next extraction starts a fresh one."""
+    global _pool
+    if _pool is pool:
+        _pool = None
+    # shutdown() doesn't stop running tasks, so kill workers stuck on a file
+    for process in list((pool._processes or {}).values()):
+        process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_pool():
+    global _pool, _pool_slots
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+        _pool_slots = None
+
+
+def upload_extension(file: UploadFile) -> str:
+    """Return the lowercase extension of an upload, or raise 400 if unsupported."""
+    extension = os.path.splitext(file.filename or "")[1].lower()
+    if extension not in SUPPORTED_EXTENSIONS:
+        raise HTTPException(status_code=400, detail="Only PDF and DOCX resumes are supported")
+    return extension
+
+
+class UploadSizeLimitMiddleware:
+    """Answer 413 to request bodies over MAX_UPLOAD_BYTES on the upload paths."""
+
+    def __init__(self, app: ASGIApp, paths: tuple[str, ...]):
+        self.app = app
+        self.paths = paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        limit = settings.max_upload_bytes + MULTIPART_OVERHEAD
+        length = Headers(scope=scope).get("content-length", "")
+        if length.isdigit() and int(length) > limit:
+            response = JSONResponse({"detail": "Resume file is too large"}, status_code=413)
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            # Chunked bodies have no Content-Length; count as they arrive
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    raise HTTPException(status_code=413, detail="Resume file is too large")
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
+async def save_upload(file: UploadFile, extension: str) -> tuple[str, str]:
+    """
+    Copy an upload to a temporary file in the upload directory while hashing it.
+
+    The caller deletes the file with discard_upload() once done with it.
+    Returns (path, sha256 hex digest).
+    """
+    os.makedirs(settings.upload_dir, exist_ok=True)
+    digest = hashlib.sha256()
+    size = 0
+
+    fd, path = tempfile.mkstemp(dir=settings.upload_dir, suffix=extension)
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while chunk := await file.read(CHUNK_SIZE):
+                size += len(chunk)
+                if size > settings.max_upload_bytes:
+                    raise HTTPException(status_code=413, detail="Resume file is too large")
+                digest.update(chunk)
+                await run_in_threadpool(out.write, chunk)
+    except BaseException:
+        discard_upload(path)
+        raise
+
+    return path, digest.hexdigest()
+
+
+def discard_upload(path: str):
+    """Delete an uploaded file; only its extracted text is kept."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+async def _extract_in(pool: ProcessPoolExecutor, path: str, extension: str) -> str:
+    loop = asyncio.get_running_loop()
+    try:
+        return await asyncio.wait_for(
+            loop.run_in_executor(pool, extract_text, path, extension),
+            settings.extraction_timeout_seconds,
+        )
+    except asyncio.TimeoutError:
+        _replace_pool(pool)
+        raise HTTPException(status_code=422, detail="Resume file took too long to read")
+    except BrokenProcessPool:
+        # A worker died (e.g. out of memory on a hostile file)
+        _replace_pool(pool)
+        raise
+    except Exception:
+        raise HTTPException(status_code=422, detail="Could not read resume file")
+
+
+async def _run_extraction(path: str, extension: str) -> str:
+    pool, _ = _get_pool()
+    try:
+        return await _extract_in(pool, path, extension)
+    except BrokenProcessPool:
+        pass
+
+    # Every upload in flight fails when one breaks the pool. Retry alone in a
+    # one-off worker, so a file that crashes again only fails its own upload.
+    solo = ProcessPoolExecutor(max_workers=1)
+    try:
+        return await _extract_in(solo, path, extension)
+    except BrokenProcessPool:
+        raise HTTPException(status_code=422, detail="Could not read resume file")
+    finally:
+        solo.shutdown(wait=False)
+
+
+async def extract_text_cached(db, path: str, extension: str, content_hash: str) -> str:
+    """Return the text of an uploaded file, extracting it in the process pool on a cache miss."""
+    cached = await db[RESUME_TEXTS_COLLECTION].find_one({"_id": content_hash})
+    if cached:
+        return cached["text"]
+
+    _, slots = _get_pool()
+    async with slots:
+        text = await _run_extraction(path, extension)
+
+    await db[RESUME_TEXTS_COLLECTION].replace_one(
+        {"_id": content_hash},
+        {"text": text, "created_at": datetime.utcnow()},
+        upsert=True,
+    )
+    return text
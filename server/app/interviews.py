@@ -0,0 +1,157 @@
+# server/app/interviews.py
+"""
+Per-user interval index of scheduled interviews.
+
+Each interview runs from `interview_date` for `interview_duration_minutes`
+(DEFAULT_INTERVIEW_MINUTES when unset). A user's interviews are kept in
+arrays sorted by start time, next to their end times, so a date range is
+located with a binary search. Because no interview is longer than the
+longest one in the index, every interview overlapping [start, end) starts
+in [start - longest, end). Conflicts and free slots for a range then cost
+one binary search plus a scan of that window: O(log n + k) for k
+interviews in the range, as long as no single interview is much longer
+than the gaps between them.
+
+Like job_index, indexes live in a version-stamped IndexStore (see
+user_indexes.py), kept for the most recently used
+INTERVIEW_INDEX_MAX_USERS users.
+"""
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from typing import Optional
+
+from .config import settings
+from .models import JOBS_COLLECTION
+from .user_indexes import IndexStore
+
+PROJECTION = {
+    "company": 1, "role": 1, "interview_date": 1,
+    "interview_duration_minutes": 1, "interview_type": 1,
+}
+
+
+def naive_utc(value: datetime) -> datetime:
+    """Convert an aware datetime to naive UTC, as stored by Mongo."""
+    if value.tzinfo is not None:
+        value = value.replace(tzinfo=None) - value.utcoffset()
+    return value
+
+
+def interview_span(doc: dict) -> Optional[tuple[datetime, datetime]]:
+    """Start and end of a job's interview, or None if it has none."""
+    start = doc.get("interview_date")
+    if start is None:
+        return None
+    start = naive_utc(start)
+    minutes = doc.get("interview_duration_minutes") or settings.default_interview_minutes
+    return start, start + timedelta(minutes=minutes)
+
+
+class InterviewIndex:
+    """One user's interviews, sorted by (start, job id)."""
+
+    def __init__(self, version: int, docs: list[dict]):
+        self.version = version
+        self.keys: list[tuple[datetime, str]] = []  # (start, job id), sorted
+        self.ends: list[datetime] = []              # parallel to keys
+        self.jobs: dict[str, dict] = {}             # job id -> slot info
+        self.longest = timedelta(0)
+
+        slots = filter(None, (self._slot(doc) for doc in docs))
+        for slot in sorted(slots, key=lambda s: (s["start"], s["job_id"])):
+            self.keys.append((slot["start"], slot["job_id"]))
+            self.ends.append(slot["end"])
+            self._track(slot)
+
+    @staticmethod
+    def _slot(doc: dict) -> Optional[dict]:
+        span = interview_span(doc)
+        if span is None:
+            return None
+        return {
+            "job_id": doc["_id"],
+            "company": doc["company"],
+            "role": doc["role"],
+            "interview_type": doc.get("interview_type"),
+            "start": span[0],
+            "end": span[1],
+        }
+
+    def _track(self, slot: dict):
+        self.jobs[slot["job_id"]] = slot
+        # Never shrinks on removal; a longer bound only widens the scan
+        self.longest = max(self.longest, slot["end"] - slot["start"])
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def remove(self, job_id: str):
+        slot = self.jobs.pop(job_id, None)
+        if slot is None:
+            return
+        i = bisect_left(self.keys, (slot["start"], job_id))
+        del self.keys[i]
+        del self.ends[i]
+
+    def upsert(self, doc: dict):
+        self.remove(doc["_id"])
+        slot = self._slot(doc)
+        if slot is None:
+            return
+        key = (slot["start"], slot["job_id"])
+        i = bisect_left(self.keys, key)
+        self.keys.insert(i, key)
+        self.ends.insert(i, slot["end"])
+        self._track(slot)
+
+    def overlapping(self, start: datetime, end: datetime) -> list[dict]:
+        """Interviews overlapping [start, end), earliest first."""
+        lo = bisect_left(self.keys, (start - self.longest,))
+        hi = bisect_left(self.keys, (end,))
+        return [
+            self.jobs[self.keys[i][1]]
+            for i in range(lo, hi)
+            if self.ends[i] > start
+        ]
+
+
+def find_conflicts(slots: list[dict]) -> list[tuple[dict, dict]]:
+    """Pairs of overlapping interviews among slots sorted by start."""
+    pairs = []
+    for i, first in enumerate(slots):
+        # Every later slot starting before this one ends is a conflict,
+        # so the scan stops at the first one that isn't
+        for second in slots[i + 1:]:
+            if second["start"] >= first["end"]:
+                break
+            pairs.append((first, second))
+    return pairs
+
+
+def find_free_slots(
+    slots: list[dict], start: datetime, end: datetime, min_length: timedelta
+) -> list[tuple[datetime, datetime]]:
+    """Gaps of at least `min_length` in [start, end) between slots sorted by start."""
+    free = []
+    cursor = start
+    for slot in slots:
+        if slot["start"] - cursor >= min_length:
+            free.append((cursor, slot["start"]))
+        cursor = max(cursor, slot["end"])
+    if end - cursor >= min_length:
+        free.append((cursor, end))
+    return free
+
+
+async def _load(db, user_id: str) -> list[dict]:
+    return await db[JOBS_COLLECTION].find(
+        {"user_id": user_id, "interview_date": {"$ne": None}}, PROJECTION
+    ).to_list(None)
+
+
+store = IndexStore(_load, InterviewIndex, budget=lambda: settings.interview_index_max_users)
+
+
+async def get_user_index(db, user_id: str) -> InterviewIndex:
+    """Return an up-to-date interview index for the user, loading it if needed."""
+    return await store.get(db, user_id)
@@ -0,0 +1,219 @@
+# server/app/job_index.py
+"""
+Optional in-memory columnar index of each user's jobs.
+
+When enabled (JOB_INDEX_ENABLED=true, requires numpy), a user's hot jobs
+are loaded once into NumPy columns (status/platform codes, created_at and
+interview_date timestamps, fit scores) next to an ID array and the raw
+documents. List filters, stats and calendar queries are then answered
+with vectorized masks instead of a Mongo scan.
+
+Indexes are kept in a version-stamped IndexStore (see user_indexes.py)
+under a global memory budget, JOB_INDEX_MAX_BYTES.
+"""
+from datetime import datetime
+from typing import Optional, get_args
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; routes fall back to Mongo
+    np = None
+
+from .config import settings
+from .models import JOBS_COLLECTION
+from .schemas import JobStatus, JobPlatform
+from .user_indexes import IndexStore
+
+STATUSES = list(get_args(JobStatus))
+PLATFORMS = list(get_args(JobPlatform))
+STATUS_CODES = {name: code for code, name in enumerate(STATUSES)}
+PLATFORM_CODES = {name: code for code, name in enumerate(PLATFORMS)}
+
+# Missing interview dates are stored as the smallest int64
+NO_DATE = -(2 ** 63)
+
+_EPOCH = datetime(1970, 1, 1)
+
+COLUMNS = ("ids", "docs", "status", "platform", "created_at", "interview_date", "fit_score")
+
+
+def _to_micros(value: Optional[datetime]) -> int:
+    """Convert a naive UTC datetime to microseconds since the epoch."""
+    if value is None:
+        return NO_DATE
+    if value.tzinfo is not None:
+        value = value.replace(tzinfo=None) - value.utcoffset()
+    delta = value - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _doc_size(doc: dict) -> int:
+    """Rough memory cost of a cached document."""
+    return 64 * len(doc) + sum(len(v) for v in doc.values() if isinstance(v, str))
+
+
+class UserJobIndex:
+    """Columnar snapshot of one user's hot jobs."""
+
+    def __init__(self, version: int, docs: list[dict]):
+        self.version = version
+        self.size = 0
+        self.doc_bytes = 0
+        capacity = max(16, len(docs))
+        self.ids = np.empty(capacity, dtype=object)
+        self.docs = np.empty(capacity, dtype=object)
+        self.status = np.zeros(capacity, dtype=np.int8)
+        self.platform = np.zeros(capacity, dtype=np.int8)
+        self.created_at = np.zeros(capacity, dtype=np.int64)
+        self.interview_date = np.zeros(capacity, dtype=np.int64)
+        self.fit_score = np.zeros(capacity, dtype=np.float32)  # NaN when unscored
+        self.rows: dict[str, int] = {}
+        for doc in docs:
+            self.upsert(doc)
+
+    @property
+    def nbytes(self) -> int:
+        columns = self.status.nbytes + self.platform.nbytes
+        columns += self.created_at.nbytes + self.interview_date.nbytes
+        columns += self.fit_score.nbytes
+        # Object arrays hold pointers; the documents are counted separately
+        columns += self.ids.nbytes + self.docs.nbytes
+        return columns + self.doc_bytes
+
+    def _grow(self):
+        capacity = len(self.ids) * 2
+        for name in COLUMNS:
+            column = getattr(self, name)
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[: self.size] = column[: self.size]
+            setattr(self, name, grown)
+
+    def upsert(self, doc: dict):
+        row = self.rows.get(doc["_id"])
+        if row is None:
+            if self.size == len(self.ids):
+                self._grow()
+            row = self.size
+            self.size += 1
+            self.rows[doc["_id"]] = row
+        else:
+            self.doc_bytes -= _doc_size(self.docs[row])
+
+        self.ids[row] = doc["_id"]
+        self.docs[row] = doc
+        self.status[row] = STATUS_CODES[doc["status"]]
+        self.platform[row] = PLATFORM_CODES[doc["platform"]]
+        self.created_at[row] = _to_micros(doc["created_at"])
+        self.interview_date[row] = _to_micros(doc.get("interview_date"))
+        fit = doc.get("fit_score")
+        self.fit_score[row] = np.nan if fit is None else fit
+        self.doc_bytes += _doc_size(doc)
+
+    def remove(self, job_id: str):
+        row = self.rows.pop(job_id, None)
+        if row is None:
+            return
+        self.doc_bytes -= _doc_size(self.docs[row])
+        last = self.size - 1
+        if row != last:
+            # Move the last row into the hole
+            for name in COLUMNS:
+                column = getattr(self, name)
+                column[row] = column[last]
+            self.rows[self.ids[row]] = row
+        self.ids[last] = None
+        self.docs[last] = None
+        self.size = last
+
+    def select(
+        self,
+        status: Optional[str] = None,
+        platform: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        min_fit: Optional[float] = None,
+        sort: str = "created_at",
+    ) -> list[dict]:
+        """Return documents matching the filters, newest (or best fit) first."""
+        n = self.size
+        mask = np.ones(n, dtype=bool)
+        if status:
+            if status not in STATUS_CODES:
+                return []
+            mask &= self.status[:n] == STATUS_CODES[status]
+        if platform:
+            if platform not in PLATFORM_CODES:
+                return []
+            mask &= self.platform[:n] == PLATFORM_CODES[platform]
+        if date_from:
+            mask &= self.created_at[:n] >= _to_micros(date_from)
+        if date_to:
+            mask &= self.created_at[:n] <= _to_micros(date_to)
+        if min_fit is not None:
+            # NaN compares False, so unscored jobs drop out like in Mongo
+            mask &= self.fit_score[:n] >= min_fit
+
+        rows = np.flatnonzero(mask)
+        rows = rows[np.argsort(-self.created_at[rows], kind="stable")]
+        if sort == "fit_score":
+            # Stable sort keeps newest first among equal scores; NaN sorts last
+            rows = rows[np.argsort(-self.fit_score[rows], kind="stable")]
+        return list(self.docs[rows])
+
+    def counts(self) -> tuple[int, dict[str, int], dict[str, int]]:
+        """Return (total, status_counts, platform_counts)."""
+        n = self.size
+        status_bins = np.bincount(self.status[:n], minlength=len(STATUSES))
+        platform_bins = np.bincount(self.platform[:n], minlength=len(PLATFORMS))
+        status_counts = {STATUSES[i]: int(c) for i, c in enumerate(status_bins) if c}
+        platform_counts = {PLATFORMS[i]: int(c) for i, c in enumerate(platform_bins) if c}
+        return n, status_counts, platform_counts
+
+    def interviews(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> list[dict]:
+        """Return documents with an interview in [start, end], earliest first."""
+        n = self.size
+        dates = self.interview_date[:n]
+        mask = dates != NO_DATE
+        if start:
+            mask &= dates >= _to_micros(start)
+        if end:
+            mask &= dates <= _to_micros(end)
+        rows = np.flatnonzero(mask)
+        rows = rows[np.argsort(dates[rows], kind="stable")]
+        return list(self.docs[rows])
+
+
+def enabled() -> bool:
+    return settings.job_index_enabled and np is not None
+
+
+async def _load(db, user_id: str) -> list[dict]:
+    return await db[JOBS_COLLECTION].find({"user_id": user_id}).to_list(None)
+
+
+def _build(version: int, docs: list[dict]) -> Optional[UserJobIndex]:
+    try:
+        return UserJobIndex(version, docs)
+    except KeyError:
+        # Legacy status/platform values outside the schema; serve from Mongo
+        return None
+
+
+store = IndexStore(
+    _load, _build,
+    budget=lambda: settings.job_index_max_bytes,
+    cost=lambda index: index.nbytes,
+)
+
+
+async def get_user_index(db, user_id: str) -> Optional[UserJobIndex]:
+    """
+    Return an up-to-date index for the user, loading it if needed.
+
+    Returns None when the index is disabled, so callers query Mongo.
+    """
+    if not enabled():
+        return None
+    return await store.get(db, user_id)
@@ -0,0 +1,179 @@
+# server/app/loop_monitor.py
+"""
+Opt-in event-loop blocking detector (LOOP_MONITOR_ENABLED=true).
+
+A heartbeat task sleeps in short intervals and measures how late it
+wakes up; lateness means something ran synchronously on the loop. A
+watchdog thread notices a stalled heartbeat while the loop is still
+blocked and captures the loop thread's stack together with the route of
+the request whose task was running. Each block is logged as a JSON line
+and aggregated per route for GET /admin/loop-blocks.
+
+In strict mode (LOOP_MONITOR_STRICT=true, meant for test runs) a request
+that blocked the loop longer than LOOP_MONITOR_BUDGET_MS raises
+LoopBlockedError, which fails the calling test.
+"""
+import asyncio
+import json
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .config import settings
+
+logger = logging.getLogger("app.loop_monitor")
+
+
+class LoopBlockedError(RuntimeError):
+    """Raised in strict mode when a request blocks the event loop past the budget."""
+
+
+class LoopMonitor:
+    def __init__(self, threshold_ms: float, interval_ms: float):
+        self.threshold = threshold_ms / 1000
+        self.interval = interval_ms / 1000
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.loop_thread_id: Optional[int] = None
+        self.last_beat = time.monotonic()
+        self.beat = 0
+        self.pending: Optional[dict] = None  # capture for the current stall
+        self.requests: dict[asyncio.Task, dict] = {}
+        self.routes: dict[str, dict] = {}
+        self.recent: deque = deque(maxlen=100)
+        self._task: Optional[asyncio.Task] = None
+        self._stop = threading.Event()
+
+    # -- lifecycle -----------------------------------------------------------
+
+    def start(self):
+        self.loop = asyncio.get_running_loop()
+        self.loop_thread_id = threading.get_ident()
+        self.last_beat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._heartbeat())
+        threading.Thread(target=self._watchdog, name="loop-watchdog", daemon=True).start()
+
+    def stop(self):
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    # -- loop side -----------------------------------------------------------
+
+    async def _heartbeat(self):
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            lag = now - expected
+            if lag >= self.threshold:
+                self._record(lag, self.pending)
+            self.pending = None
+            self.last_beat = now
+            self.beat += 1
+
+    def _record(self, lag: float, capture: Optional[dict]):
+        capture = capture or {"route": "unknown", "stack": []}
+        lag_ms = round(lag * 1000, 1)
+        entry = {"route": capture["route"], "lag_ms": lag_ms, "stack": capture["stack"]}
+        self.recent.append(entry)
+
+        stats = self.routes.setdefault(
+            capture["route"], {"route": capture["route"], "count": 0, "total_ms": 0.0, "max_ms": 0.0}
+        )
+        stats["count"] += 1
+        stats["total_ms"] += lag_ms
+        if lag_ms >= stats["max_ms"]:
+            stats["max_ms"] = lag_ms
+            stats["stack"] = capture["stack"]
+
+        request = capture.get("request")
+        if request is not None:
+            request["blocked_ms"] = max(request["blocked_ms"], lag_ms)
+
+        logger.warning(json.dumps({
+            "event": "event_loop_blocked",
+            "route": capture["route"],
+            "lag_ms": lag_ms,
+            "where": capture["stack"][-1].strip() if capture["stack"] else None,
+        }))
+
+    # -- watchdog thread -----------------------------------------------------
+
+    def _watchdog(self):
+        captured_beat = -1
+        while not self._stop.wait(self.threshold / 4):
+            stalled = time.monotonic() - self.last_beat > self.interval + self.threshold
+            if stalled and captured_beat != self.beat:
+                captured_beat = self.beat
+                self.pending = self._capture()
+
+    def _capture(self) -> dict:
+        """Capture the loop thread's stack and the request being served."""
+        frame = sys._current_frames().get(self.loop_thread_id)
+        stack = traceback.format_stack(frame) if frame is not None else []
+        task = asyncio.current_task(self.loop)
+        request = self.requests.get(task)
+        route = "unknown"
+        if request is not None:
+            scope = request["scope"]
+            # FastAPI stores the matched route in the scope once routing is done
+            route_obj = scope.get("route")
+            path = getattr(route_obj, "path", None) or scope.get("path", "")
+            route = f"{scope.get('method', '')} {path}".strip()
+        return {"route": route, "stack": stack, "request": request}
+
+    async def settle(self):
+        """Wait for the next heartbeat so a block that just ended is recorded."""
+        beat = self.beat
+        while self.beat == beat and self._task is not None:
+            await asyncio.sleep(self.interval / 2)
+
+    # -- reporting -----------------------------------------------------------
+
+    def worst(self, limit: int = 20) -> list[dict]:
+        """Routes with the longest blocks, worst first."""
+        ranked = sorted(self.routes.values(), key=lambda s: s["max_ms"], reverse=True)
+        return [
+            {**stats, "total_ms": round(stats["total_ms"], 1)}
+            for stats in ranked[:limit]
+        ]
+
+
+monitor = LoopMonitor(settings.loop_monitor_threshold_ms, settings.loop_monitor_interval_ms)
+
+
+class LoopMonitorMiddleware:
+    """Tracks which request each task serves, so blocks can be attributed to routes."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        task = asyncio.current_task()
+        request = {"scope": scope, "blocked_ms": 0.0}
+        monitor.requests[task] = request
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            monitor.requests.pop(task, None)
+
+        if settings.loop_monitor_strict:
+            # A block that just ended is only recorded at the next heartbeat
+            await monitor.settle()
+            if request["blocked_ms"] > settings.loop_monitor_budget_ms:
+                raise LoopBlockedError(
+                    f"{scope.get('method')} {scope.get('path')} blocked the event loop for "
+                    f"{request['blocked_ms']} ms (budget {settings.loop_monitor_budget_ms} ms)"
+                )
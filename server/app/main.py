@@ -2,12 +2,18 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from .routers import auth_routes, jobs_routes, ai_routes, email_routes
-from .database import get_db
+from .routers import auth_routes, jobs_routes, ai_routes, email_routes, resume_routes, admin_routes
+from .database import get_db, ensure_indexes
+from .archive import start_archiver, stop_archiver
+from .descriptions import start_sweeper, stop_sweeper
+from .extraction import shutdown_pool, UploadSizeLimitMiddleware
+from .compression import CompressionMiddleware
+from .loop_monitor import monitor, LoopMonitorMiddleware
+from .profiling import ProfilingMiddleware, ProfiledJSONResponse
 from .config import settings
 
 
-app = FastAPI(title="Job Tracker API")
+app = FastAPI(title="Job Tracker API", default_response_class=ProfiledJSONResponse)
 
 origins = [
     "http://localhost:5173",
@@ -25,11 +31,43 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(UploadSizeLimitMiddleware, paths=("/resumes/upload",))
+
+if settings.compression_enabled:
+    app.add_middleware(CompressionMiddleware, min_size=settings.compression_min_bytes)
+
+if settings.loop_monitor_enabled:
+    app.add_middleware(LoopMonitorMiddleware)
+
+if settings.profiling_enabled:
+    app.add_middleware(ProfilingMiddleware)
+
 app.include_router(auth_routes.router)
 
 app.include_router(jobs_routes.router)
 app.include_router(ai_routes.router)
 app.include_router(email_routes.router)
+app.include_router(resume_routes.router)
+app.include_router(admin_routes.router)
+
+
+@app.on_event("startup")
+async def startup():
+    db = get_db()
+    await ensure_indexes(db)
+    start_archiver(db)
+    start_sweeper(db)
+    if settings.loop_monitor_enabled:
+        monitor.start()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    stop_archiver()
+    stop_sweeper()
+    monitor.stop()
+    shutdown_pool()
+
 
 @app.get("/")
 async def root():
@@ -2,3 +2,8 @@
 
 USERS_COLLECTION = "users"
 JOBS_COLLECTION = "jobs"
+ARCHIVED_JOBS_COLLECTION = "jobs_archive"
+JOB_TOMBSTONES_COLLECTION = "job_tombstones"
+RESUMES_COLLECTION = "resumes"
+RESUME_TEXTS_COLLECTION = "resume_texts"
+DESCRIPTIONS_COLLECTION = "job_descriptions"
@@ -0,0 +1,345 @@
+# server/app/profiling.py
+"""
+On-demand request profiling (PROFILING_ENABLED=true).
+
+A request is profiled when it carries `X-Profile: <ADMIN_TOKEN>` or is
+picked by PROFILE_SAMPLE_RATE. For profiled requests:
+
+- a sampling thread records the event-loop thread's stack every few
+  milliseconds while the request's task is running (and a
+  "<suspended>" sample while it is awaiting), in folded-stack format
+  ready for flamegraph.pl / speedscope;
+- wall time is split into exclusive spans: "mongo" (awaits on the
+  database), "auth" (get_current_user), "serialize" (serialize_job and
+  friends) and "json" (response rendering). The remainder is "other".
+
+Results are kept in a bounded in-memory store and served by
+/admin/profiles. The response carries `X-Profile-Id` to look them up.
+Requests that are not profiled only pay for a context variable lookup,
+and with profiling disabled the decorators return functions unchanged.
+Background work started from a profiled request must use unwrap_db()
+and detached_task() so it doesn't write into the request's profile.
+"""
+import asyncio
+import contextvars
+import functools
+import random
+import secrets
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Optional
+
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .config import settings
+
+OTHER_STACK = "<other stacks>"
+SUSPENDED_STACK = "<suspended>"
+
+
+class RequestProfile:
+    def __init__(self, scope: Scope):
+        self.id = uuid.uuid4().hex
+        self.method = scope.get("method", "")
+        self.path = scope.get("path", "")
+        self.scope = scope
+        self.started_at = datetime.utcnow()
+        self.start = time.perf_counter()
+        self.wall_ms = 0.0
+        self.spans: dict[str, float] = {}
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._open: list[list] = []  # [category, start, child_time]
+
+    def add_stack(self, folded: str):
+        self.samples += 1
+        if folded not in self.stacks and len(self.stacks) >= settings.profile_max_stacks:
+            folded = OTHER_STACK
+        self.stacks[folded] += 1
+
+    def finish(self):
+        self.wall_ms = (time.perf_counter() - self.start) * 1000
+        route = self.scope.get("route")
+        self.route = getattr(route, "path", None) or self.path
+        self.scope = None
+
+    def summary(self) -> dict:
+        spans = {name: round(ms, 2) for name, ms in self.spans.items()}
+        spans["other"] = round(max(0.0, self.wall_ms - sum(self.spans.values())), 2)
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "route": self.route,
+            "started_at": self.started_at,
+            "wall_ms": round(self.wall_ms, 2),
+            "spans_ms": spans,
+            "samples": self.samples,
+        }
+
+    def folded(self) -> str:
+        return "\n".join(f"{stack} {count}" for stack, count in self.stacks.most_common())
+
+
+current_profile: ContextVar[Optional[RequestProfile]] = ContextVar("current_profile", default=None)
+
+
+@contextmanager
+def span(category: str):
+    """Attribute the wall time of a block to `category` (exclusive of nested spans)."""
+    profile = current_profile.get()
+    if profile is None:
+        yield
+        return
+    entry = [category, time.perf_counter(), 0.0]
+    profile._open.append(entry)
+    try:
+        yield
+    finally:
+        profile._open.pop()
+        elapsed = time.perf_counter() - entry[1]
+        exclusive = elapsed - entry[2]
+        profile.spans[category] = profile.spans.get(category, 0.0) + exclusive * 1000
+        if profile._open:
+            profile._open[-1][2] += elapsed
+
+
+def profiled(category: str):
+    """Decorator form of span() for plain and async functions."""
+    def decorator(fn):
+        if not settings.profiling_enabled:
+            return fn
+
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                if current_profile.get() is None:
+                    return await fn(*args, **kwargs)
+                with span(category):
+                    return await fn(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if current_profile.get() is None:
+                return fn(*args, **kwargs)
+            with span(category):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# =============================================================================
+# Mongo instrumentation
+# =============================================================================
+
+_CURSOR_CHAIN = {"sort", "limit", "skip", "batch_size"}
+
+
+class ProfiledCursor:
+    """Times cursor iteration as "mongo"."""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def __getattr__(self, name):
+        attr = getattr(self._cursor, name)
+        if name in _CURSOR_CHAIN:
+            return lambda *args, **kwargs: ProfiledCursor(attr(*args, **kwargs))
+        if name == "to_list":
+            # Motor's to_list returns a future, so time the await, not the call
+            return _maybe_awaitable(attr)
+        return attr
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        with span("mongo"):
+            return await self._cursor.__anext__()
+
+
+class ProfiledCollection:
+    """Times every awaited collection call as "mongo"."""
+
+    def __init__(self, collection):
+        self._collection = collection
+
+    def __getattr__(self, name):
+        attr = getattr(self._collection, name)
+        if name in ("find", "aggregate"):
+            return lambda *args, **kwargs: ProfiledCursor(attr(*args, **kwargs))
+        if callable(attr):
+            return _maybe_awaitable(attr)
+        return attr
+
+
+def _maybe_awaitable(fn):
+    # Motor methods return futures, so time whatever awaitable comes back
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        result = fn(*args, **kwargs)
+        if asyncio.isfuture(result) or asyncio.iscoroutine(result):
+            return _timed_await(result)
+        return result
+    return wrapper
+
+
+async def _timed_await(awaitable):
+    with span("mongo"):
+        return await awaitable
+
+
+class ProfiledDatabase:
+    """Database wrapper handed to profiled requests by get_db."""
+
+    def __init__(self, db):
+        self._db = db
+
+    def __getitem__(self, name):
+        return ProfiledCollection(self._db[name])
+
+    def __getattr__(self, name):
+        return getattr(self._db, name)
+
+
+def wrap_db(db):
+    """Return a profiling wrapper for the db when the current request is profiled."""
+    return ProfiledDatabase(db) if current_profile.get() is not None else db
+
+
+def unwrap_db(db):
+    """Return the plain database behind a profiling wrapper."""
+    return db._db if isinstance(db, ProfiledDatabase) else db
+
+
+def detached_task(coro) -> asyncio.Task:
+    """Start a background task outside the current request's profile."""
+    # Tasks copy the context they are created in, so create it in an empty one
+    return contextvars.Context().run(asyncio.create_task, coro)
+
+
+# =============================================================================
+# Sampling thread
+# =============================================================================
+
+def fold_stack(frame) -> str:
+    """Format a frame chain as a folded stack (root first, ';'-separated)."""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{code.co_name} ({code.co_filename.rsplit('/', 1)[-1]}:{frame.f_lineno})")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class Sampler:
+    def __init__(self):
+        self.active: dict[asyncio.Task, RequestProfile] = {}
+        self.lock = threading.Lock()
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.loop_thread_id: Optional[int] = None
+        self.thread: Optional[threading.Thread] = None
+
+    def add(self, task: asyncio.Task, profile: RequestProfile):
+        with self.lock:
+            self.loop = asyncio.get_running_loop()
+            self.loop_thread_id = threading.get_ident()
+            self.active[task] = profile
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+                self.thread.start()
+
+    def remove(self, task: asyncio.Task):
+        with self.lock:
+            self.active.pop(task, None)
+
+    def _run(self):
+        interval = settings.profile_sample_interval_ms / 1000
+        while True:
+            time.sleep(interval)
+            with self.lock:
+                if not self.active:
+                    self.thread = None
+                    return
+                profiles = list(self.active.items())
+                loop, thread_id = self.loop, self.loop_thread_id
+
+            running = asyncio.current_task(loop)
+            frame = sys._current_frames().get(thread_id)
+            for task, profile in profiles:
+                if task is running and frame is not None:
+                    profile.add_stack(fold_stack(frame))
+                else:
+                    profile.add_stack(SUSPENDED_STACK)
+
+
+sampler = Sampler()
+
+# Finished profiles, oldest first
+profiles: "OrderedDict[str, RequestProfile]" = OrderedDict()
+
+
+def _store(profile: RequestProfile):
+    profiles[profile.id] = profile
+    while len(profiles) > settings.profile_max_entries:
+        profiles.popitem(last=False)
+
+
+# =============================================================================
+# Middleware and response class
+# =============================================================================
+
+def _should_profile(scope: Scope) -> bool:
+    token = Headers(scope=scope).get("x-profile")
+    if token and settings.admin_token and secrets.compare_digest(token, settings.admin_token):
+        return True
+    return random.random() < settings.profile_sample_rate
+
+
+class ProfilingMiddleware:
+    """Profiles requests selected by the X-Profile header or the sample rate."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not _should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile(scope)
+        token = current_profile.set(profile)
+        task = asyncio.current_task()
+        sampler.add(task, profile)
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                MutableHeaders(raw=message["headers"])["X-Profile-Id"] = profile.id
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            sampler.remove(task)
+            current_profile.reset(token)
+            profile.finish()
+            _store(profile)
+
+
+class ProfiledJSONResponse(JSONResponse):
+    """Default response class; times JSON encoding as "json" for profiled requests."""
+
+    def render(self, content) -> bytes:
+        if current_profile.get() is None:
+            return super().render(content)
+        with span("json"):
+            return super().render(content)
@@ -0,0 +1,52 @@
+# server/app/routers/admin_routes.py
+"""
+Operational endpoints, guarded by the ADMIN_TOKEN setting.
+"""
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import PlainTextResponse
+
+from ..cache import cache
+from ..deps import require_admin
+from ..loop_monitor import monitor
+from ..profiling import profiles
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin)])
+
+
+@router.get("/loop-blocks")
+async def get_loop_blocks(limit: int = 20):
+    """Routes that blocked the event loop the longest, with the captured stack."""
+    return {
+        "threshold_ms": monitor.threshold * 1000,
+        "worst": monitor.worst(limit),
+        "recent": list(monitor.recent)[-limit:],
+    }
+
+
+@router.get("/cache")
+async def get_cache_stats():
+    """Hit/miss counters per cache layer on this node."""
+    return cache.info()
+
+
+@router.get("/profiles")
+async def list_profiles():
+    """Summaries of stored request profiles, newest first."""
+    return {"profiles": [profile.summary() for profile in reversed(profiles.values())]}
+
+
+@router.get("/profiles/{profile_id}")
+async def get_profile(profile_id: str):
+    profile = profiles.get(profile_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return profile.summary()
+
+
+@router.get("/profiles/{profile_id}/folded", response_class=PlainTextResponse)
+async def get_profile_folded(profile_id: str):
+    """Folded stacks for flamegraph.pl or speedscope."""
+    profile = profiles.get(profile_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return profile.folded()
@@ -1,30 +1,75 @@
 # server/app/routers/ai_routes.py
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, HTTPException
+from ..database import get_db
+from ..deps import get_current_user
+from ..models import JOBS_COLLECTION
+from ..descriptions import load_description
+from ..scoring import fit_score, find_resume, job_text
 from ..schemas import (
     AISummarizeRequest,
     AISummarizeResponse,
     AICompareRequest,
     AICompareResponse,
+    AIJobCompareRequest,
 )
 
 router = APIRouter(prefix="/ai", tags=["ai"])
 
+
+def summarize_text(text: str) -> str:
+    # Simple fake summary. Later: integrate OpenAI/Gemini etc.
+    return text[:300] + ("..." if len(text) > 300 else "")
+
+
+async def load_job_description(db, job_id: str, user_id: str) -> tuple[dict, str]:
+    """Return the job and its stored description, or raise 404."""
+    job = await db[JOBS_COLLECTION].find_one({"_id": job_id, "user_id": user_id})
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    description = await load_description(db, job.get("description_hash"))
+    if not description:
+        raise HTTPException(status_code=400, detail="No description saved for this job")
+    return job, description
+
+
 @router.post("/summarize", response_model=AISummarizeResponse)
 async def summarize_job(req: AISummarizeRequest):
-    # Simple fake summary. Later: integrate OpenAI/Gemini etc.
-    text = req.job_description
-    short = text[:300] + ("..." if len(text) > 300 else "")
-    return AISummarizeResponse(summary=short)
+    return AISummarizeResponse(summary=summarize_text(req.job_description))
 
 @router.post("/compare", response_model=AICompareResponse)
 async def compare(req: AICompareRequest):
     # Very naive "score" based on overlapping words
-    jd_words = set(req.job_description.lower().split())
-    cv_words = set(req.resume_text.lower().split())
-    overlap = len(jd_words & cv_words)
-    total = len(jd_words) or 1
-    score = min(100.0, (overlap / total) * 100 * 2)  # rough
     return AICompareResponse(
-        score=round(score, 1),
+        score=fit_score(req.job_description, req.resume_text),
+        comment="Rough overlap-based score. Integrate real AI for production."
+    )
+
+@router.post("/jobs/{job_id}/summarize", response_model=AISummarizeResponse)
+async def summarize_saved_job(
+    job_id: str,
+    db=Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Summarize the description stored with a saved job."""
+    _, description = await load_job_description(db, job_id, current_user["sub"])
+    return AISummarizeResponse(summary=summarize_text(description))
+
+@router.post("/jobs/{job_id}/compare", response_model=AICompareResponse)
+async def compare_saved_job(
+    job_id: str,
+    req: AIJobCompareRequest,
+    db=Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Compare a saved job's description with a resume."""
+    job, description = await load_job_description(db, job_id, current_user["sub"])
+    resume_text = req.resume_text
+    if resume_text is None:
+        resume = await find_resume(db, current_user["sub"], job.get("resume_version"))
+        if not resume:
+            raise HTTPException(status_code=400, detail="No resume saved for this job")
+        resume_text = resume["text"]
+    return AICompareResponse(
+        score=fit_score(job_text(job, description), resume_text),
         comment="Rough overlap-based score. Integrate real AI for production."
     )
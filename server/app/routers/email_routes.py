@@ -7,11 +7,13 @@ from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 
+from ..cache import cache
 from ..config import settings
 from ..deps import get_current_user
 from ..database import get_db
 from ..models import JOBS_COLLECTION
 from ..schemas import EmailReminderRequest, EmailReminderResponse
+from ..sync import reserve_versions
 
 router = APIRouter(prefix="/email", tags=["email"])
 
@@ -168,10 +170,12 @@ Good luck with your interview!
         raise HTTPException(status_code=500, detail="Failed to send reminder email")
 
     # Mark reminder as sent
-    await db[JOBS_COLLECTION].update_one(
-        {"_id": req.job_id},
-        {"$set": {"reminder_sent": True}}
-    )
+    async with reserve_versions(db, user_id) as version:
+        await db[JOBS_COLLECTION].update_one(
+            {"_id": req.job_id},
+            {"$set": {"reminder_sent": True, "version": version}}
+        )
+    await cache.invalidate_user(user_id)
 
     return {
         "message": f"Interview reminder sent for {job['company']} - {job['role']}",
@@ -3,21 +3,35 @@
 Job management API routes.
 Handles CRUD operations for job applications.
 """
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timedelta
+from typing import List, Literal, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from bson import ObjectId
-from pymongo import ReturnDocument
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError
 
 from ..database import get_db
-from ..models import JOBS_COLLECTION
-from ..schemas import JobCreate, JobUpdate, JobOut, StatsOut
+from ..models import JOBS_COLLECTION, ARCHIVED_JOBS_COLLECTION, JOB_TOMBSTONES_COLLECTION
+from ..archive import decompress_job, restore_job
+from ..sync import reserve_versions, current_version, add_tombstones
+from .. import job_index, interviews, user_indexes
+from ..cache import cache
+from ..scoring import score_jobs, SCORED_FIELDS
+from ..descriptions import store_description, load_description
+from ..schemas import (
+    JobCreate, JobUpdate, JobOut, StatsOut, SyncOut,
+    JobBulkCreate, JobBulkResponse, JobBulkResult, JobDescriptionOut,
+    JobBatchRequest, JobBatchResponse, JobBatchResult,
+    InterviewScheduleOut, InterviewConflict, InterviewSlot, FreeSlot,
+)
 from ..deps import get_current_user
+from ..profiling import profiled
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
 
+@profiled("serialize")
 def serialize_job(doc: dict) -> JobOut:
     """Convert MongoDB document to JobOut schema."""
     return JobOut(
@@ -32,14 +46,59 @@ def serialize_job(doc: dict) -> JobOut:
         notes=doc.get("notes"),
         resume_version=doc.get("resume_version"),
         interview_date=doc.get("interview_date"),
+        interview_duration_minutes=doc.get("interview_duration_minutes"),
         interview_type=doc.get("interview_type"),
         interview_notes=doc.get("interview_notes"),
         reminder_sent=doc.get("reminder_sent", False),
         created_at=doc["created_at"],
         updated_at=doc["updated_at"],
+        archived=doc.get("archived", False),
+        version=doc.get("version", 0),
+        fit_score=doc.get("fit_score"),
+        description_hash=doc.get("description_hash"),
     )
 
 
+def build_job_query(
+    user_id: str,
+    status: Optional[str] = None,
+    platform: Optional[str] = None,
+    company: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+) -> dict:
+    """Build the Mongo filter for a user's jobs from list filters."""
+    query: dict = {"user_id": user_id}
+
+    if status:
+        query["status"] = status
+    if platform:
+        query["platform"] = platform
+    if company:
+        query["company"] = {"$regex": company, "$options": "i"}
+    if date_from or date_to:
+        created_filter = {}
+        if date_from:
+            created_filter["$gte"] = date_from
+        if date_to:
+            created_filter["$lte"] = date_to
+        query["created_at"] = created_filter
+    return query
+
+
+# JobUpdate fields that every stored job must have; null can't clear them
+REQUIRED_FIELDS = ("company", "role", "job_link", "status", "platform", "reminder_sent")
+
+
+def job_patch(job: JobUpdate) -> dict:
+    """Return the fields set in a JobUpdate, rejecting nulls for required fields."""
+    patch = job.model_dump(exclude_unset=True)
+    cleared = [field for field in REQUIRED_FIELDS if field in patch and patch[field] is None]
+    if cleared:
+        raise HTTPException(status_code=400, detail=f"Fields can't be null: {', '.join(cleared)}")
+    return patch
+
+
 @router.post("/", response_model=JobOut)
 async def create_job(
     job: JobCreate,
@@ -60,15 +119,109 @@ async def create_job(
         "notes": job.notes,
         "resume_version": job.resume_version,
         "interview_date": job.interview_date,
+        "interview_duration_minutes": job.interview_duration_minutes,
         "interview_type": job.interview_type,
         "interview_notes": job.interview_notes,
         "reminder_sent": job.reminder_sent,
+        "description_hash": await store_description(db, job.description or ""),
         "created_at": now,
         "updated_at": now,
     }
-    await db[JOBS_COLLECTION].insert_one(doc)
+    descriptions = {doc["description_hash"]: job.description.strip()} if doc["description_hash"] else {}
+    await score_jobs(db, current_user["sub"], [doc], descriptions)
+    async with reserve_versions(db, current_user["sub"]) as version:
+        doc["version"] = version
+        await db[JOBS_COLLECTION].insert_one(doc)
+    user_indexes.apply_upsert(current_user["sub"], doc)
+    await cache.invalidate_user(current_user["sub"])
     return serialize_job(doc)
 
+@router.post("/bulk", response_model=JobBulkResponse)
+async def create_jobs_bulk(
+    req: JobBulkCreate,
+    db=Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """
+    Create several jobs in one request (used by the extension's offline queue).
+
+    Items whose idempotency key was already saved are not inserted again,
+    so a client can safely retry a batch after a network error.
+    """
+    user_id = current_user["sub"]
+
+    # Collapse repeated keys within the batch, keeping the first
+    items = {}
+    for item in req.jobs:
+        items.setdefault(item.idempotency_key, item)
+
+    existing = {
+        doc["idempotency_key"]: doc["_id"]
+        async for doc in db[JOBS_COLLECTION].find(
+            {"user_id": user_id, "idempotency_key": {"$in": list(items)}},
+            {"idempotency_key": 1},
+        )
+    }
+
+    new_items = [item for key, item in items.items() if key not in existing]
+    docs = []
+    descriptions: dict[str, str] = {}
+    if new_items:
+        now = datetime.utcnow()
+        for item in new_items:
+            doc = item.model_dump(exclude={"description"})
+            doc["description_hash"] = await store_description(db, item.description or "")
+            if doc["description_hash"]:
+                descriptions[doc["description_hash"]] = item.description.strip()
+            doc.update({
+                "_id": str(ObjectId()),
+                "user_id": user_id,
+                "created_at": now,
+                "updated_at": now,
+            })
+            docs.append(doc)
+        await score_jobs(db, user_id, docs, descriptions)
+
+    inserted: dict[str, str] = {}
+    if docs:
+        async with reserve_versions(db, user_id, len(docs)) as first_version:
+            for i, doc in enumerate(docs):
+                doc["version"] = first_version + i
+            try:
+                await db[JOBS_COLLECTION].insert_many(docs, ordered=False)
+                inserted = {doc["idempotency_key"]: doc["_id"] for doc in docs}
+            except BulkWriteError as e:
+                # A concurrent retry saved some keys first; report those as existing
+                failed = {docs[err["index"]]["idempotency_key"] for err in e.details["writeErrors"]}
+                inserted = {
+                    doc["idempotency_key"]: doc["_id"]
+                    for doc in docs if doc["idempotency_key"] not in failed
+                }
+                async for doc in db[JOBS_COLLECTION].find(
+                    {"user_id": user_id, "idempotency_key": {"$in": list(failed)}},
+                    {"idempotency_key": 1},
+                ):
+                    existing[doc["idempotency_key"]] = doc["_id"]
+
+    for doc in docs:
+        if doc["idempotency_key"] in inserted:
+            user_indexes.apply_upsert(user_id, doc)
+    if inserted:
+        await cache.invalidate_user(user_id)
+
+    results = []
+    reported: set[str] = set()
+    for item in req.jobs:
+        key = item.idempotency_key
+        if key in inserted:
+            # Only the first copy of a key repeated within the batch was inserted
+            created = key not in reported
+            results.append(JobBulkResult(idempotency_key=key, id=inserted[key], created=created))
+        elif key in existing:
+            results.append(JobBulkResult(idempotency_key=key, id=existing[key], created=False))
+        reported.add(key)
+    return JobBulkResponse(results=results)
+
 @router.get("/", response_model=List[JobOut])
 async def list_jobs(
     db=Depends(get_db),
@@ -78,43 +231,90 @@ async def list_jobs(
     company: Optional[str] = None,
     date_from: Optional[datetime] = Query(None),
     date_to: Optional[datetime] = Query(None),
+    include_archived: bool = False,
+    min_fit: Optional[float] = Query(None, ge=0, le=100),
+    sort: Literal["created_at", "fit_score"] = "created_at",
 ):
-    query: dict = {"user_id": current_user["sub"]}   # FIXED
+    user_id = current_user["sub"]
+    params = (status, platform, company, date_from, date_to, include_archived, min_fit, sort)
+    return await cache.get_user_cached(
+        user_id, f"jobs:{params!r}", lambda: _list_jobs(db, user_id, *params)
+    )
 
-    if status:
-        query["status"] = status
-    if platform:
-        query["platform"] = platform
-    if company:
-        query["company"] = {"$regex": company, "$options": "i"}
-    if date_from or date_to:
-        created_filter = {}
-        if date_from:
-            created_filter["$gte"] = date_from
-        if date_to:
-            created_filter["$lte"] = date_to
-        query["created_at"] = created_filter
 
-    cursor = db[JOBS_COLLECTION].find(query).sort("created_at", -1)
+async def _list_jobs(
+    db, user_id: str, status, platform, company, date_from, date_to, include_archived, min_fit, sort
+) -> List[JobOut]:
+    # Company search is a regex, which the in-memory index doesn't cover
+    if not include_archived and not company:
+        index = await job_index.get_user_index(db, user_id)
+        if index is not None:
+            docs = index.select(status, platform, date_from, date_to, min_fit, sort)
+            return [serialize_job(doc) for doc in docs]
+
+    query = build_job_query(user_id, status, platform, company, date_from, date_to)
+    if min_fit is not None:
+        query["fit_score"] = {"$gte": min_fit}
+
+    # Served by the (user_id, fit_score, created_at) index
+    order = [("created_at", -1)]
+    if sort == "fit_score":
+        order = [("fit_score", -1), ("created_at", -1)]
+
+    cursor = db[JOBS_COLLECTION].find(query).sort(order)
     jobs = [serialize_job(doc) async for doc in cursor]
+
+    if include_archived:
+        # Archive docs keep the filterable fields, so the same query applies
+        cursor = db[ARCHIVED_JOBS_COLLECTION].find(query)
+        async for archived in cursor:
+            doc = decompress_job(archived)
+            doc["archived"] = True
+            jobs.append(serialize_job(doc))
+        jobs.sort(key=lambda job: job.created_at, reverse=True)
+        if sort == "fit_score":
+            jobs.sort(key=lambda job: -1 if job.fit_score is None else job.fit_score, reverse=True)
+
     return jobs
 
 @router.get("/stats", response_model=StatsOut)
 async def get_stats(
     db=Depends(get_db),
     current_user=Depends(get_current_user),
+    include_archived: bool = False,
 ):
-    query = {"user_id": current_user["sub"]}   # FIXED
-    cursor = db[JOBS_COLLECTION].find(query)
+    user_id = current_user["sub"]
+    return await cache.get_user_cached(
+        user_id, f"stats:{include_archived}", lambda: _stats(db, user_id, include_archived)
+    )
+
+
+async def _stats(db, user_id: str, include_archived: bool) -> StatsOut:
+    if not include_archived:
+        index = await job_index.get_user_index(db, user_id)
+        if index is not None:
+            total, status_counts, platform_counts = index.counts()
+            return StatsOut(
+                total_applications=total,
+                status_counts=status_counts,
+                platform_counts=platform_counts,
+            )
+
+    query = {"user_id": user_id}
+    projection = {"status": 1, "platform": 1}
+    collections = [JOBS_COLLECTION]
+    if include_archived:
+        collections.append(ARCHIVED_JOBS_COLLECTION)
 
     total = 0
     status_counts: dict[str, int] = {}
     platform_counts: dict[str, int] = {}
 
-    async for doc in cursor:
-        total += 1
-        status_counts[doc["status"]] = status_counts.get(doc["status"], 0) + 1
-        platform_counts[doc["platform"]] = platform_counts.get(doc["platform"], 0) + 1
+    for collection in collections:
+        async for doc in db[collection].find(query, projection):
+            total += 1
+            status_counts[doc["status"]] = status_counts.get(doc["status"], 0) + 1
+            platform_counts[doc["platform"]] = platform_counts.get(doc["platform"], 0) + 1
 
     return StatsOut(
         total_applications=total,
@@ -122,6 +322,159 @@ async def get_stats(
         platform_counts=platform_counts,
     )
 
+@router.post("/batch", response_model=JobBatchResponse)
+async def batch_jobs(
+    req: JobBatchRequest,
+    db=Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """
+    Update or delete many jobs in one request.
+
+    Jobs are selected by `ids` or by `filter` (exactly one of them). An
+    empty filter selects every job and is only accepted with `all: true`.
+    Writes go out as a single bulk_write/delete_many scoped to the user,
+    and the result lists the outcome for every selected ID.
+    """
+    user_id = current_user["sub"]
+    if (req.ids is None) == (req.filter is None):
+        raise HTTPException(status_code=400, detail="Provide either ids or filter")
+
+    if req.ids is not None:
+        query = {"user_id": user_id, "_id": {"$in": req.ids}}
+        requested = list(dict.fromkeys(req.ids))
+    else:
+        criteria = req.filter.model_dump()
+        if not any(value is not None for value in criteria.values()) and not req.all:
+            raise HTTPException(
+                status_code=400, detail="Filter has no criteria; set all=true to select every job"
+            )
+        query = build_job_query(user_id, **criteria)
+        requested = []
+
+    if req.action == "update":
+        patch = job_patch(req.patch) if req.patch else {}
+        if not patch:
+            raise HTTPException(status_code=400, detail="Update requires a non-empty patch")
+        changed = await _batch_update(db, user_id, query, patch)
+        done_status = "updated"
+    else:
+        changed = await _batch_delete(db, user_id, query)
+        done_status = "deleted"
+
+    # Caches are refreshed once for the whole batch
+    user_indexes.invalidate(user_id)
+    await cache.invalidate_user(user_id)
+
+    results = [JobBatchResult(id=job_id, status=done_status) for job_id in changed]
+    done = set(changed)
+    results += [
+        JobBatchResult(id=job_id, status="not_found")
+        for job_id in requested if job_id not in done
+    ]
+    return JobBatchResponse(matched=len(changed), results=results)
+
+
+async def _batch_update(db, user_id: str, query: dict, patch: dict) -> list[str]:
+    """Apply a JobUpdate patch to matching jobs. Returns the IDs updated."""
+    patch["updated_at"] = datetime.utcnow()
+
+    description = None
+    if "description" in patch:
+        description = (patch.pop("description") or "").strip()
+
+    rescore = description is not None or bool(SCORED_FIELDS & patch.keys())
+    projection = {field: 1 for field in SCORED_FIELDS} if rescore else {"_id": 1}
+    docs = await db[JOBS_COLLECTION].find(query, projection).to_list(None)
+    if not docs:
+        return []
+
+    descriptions: dict[str, str] = {}
+    if description is not None:
+        # Stored only when some job will reference it
+        patch["description_hash"] = await store_description(db, description)
+        if description:
+            descriptions[patch["description_hash"]] = description
+
+    if rescore:
+        for doc in docs:
+            doc.update(patch)
+        await score_jobs(db, user_id, docs, descriptions)
+
+    # Every job still gets its own sync version, so the $set differs per row
+    async with reserve_versions(db, user_id, len(docs)) as first_version:
+        updates = []
+        for i, doc in enumerate(docs):
+            fields = {**patch, "version": first_version + i}
+            if rescore:
+                fields["fit_score"] = doc["fit_score"]
+                fields["fit_resume"] = doc["fit_resume"]
+            updates.append(UpdateOne({"_id": doc["_id"], "user_id": user_id}, {"$set": fields}))
+        result = await db[JOBS_COLLECTION].bulk_write(updates, ordered=False)
+
+    ids = [doc["_id"] for doc in docs]
+    if result.matched_count < len(ids):
+        # Some jobs were deleted concurrently
+        ids = await db[JOBS_COLLECTION].distinct("_id", {"user_id": user_id, "_id": {"$in": ids}})
+    return ids
+
+
+async def _batch_delete(db, user_id: str, query: dict) -> list[str]:
+    """Delete matching jobs and record their tombstones. Returns the IDs deleted."""
+    ids = await db[JOBS_COLLECTION].distinct("_id", query)
+    if not ids:
+        return []
+
+    # Tombstones are upserts, so jobs deleted concurrently elsewhere are harmless
+    await db[JOBS_COLLECTION].delete_many({"user_id": user_id, "_id": {"$in": ids}})
+    await add_tombstones(db, user_id, ids)
+    return ids
+
+@router.get("/sync", response_model=SyncOut)
+async def sync_jobs(
+    db=Depends(get_db),
+    current_user=Depends(get_current_user),
+    since: int = Query(0, ge=0),
+):
+    """
+    Return jobs changed and deleted after version `since`.
+
+    Clients store the returned `version` and pass it as `since` next time.
+    `since=0` returns the full job list.
+    """
+    user_id = current_user["sub"]
+    # Read the version first. It stops below writes still in flight (see
+    # sync.py), so those are sent on the next sync instead of being skipped
+    version = await current_version(db, user_id)
+
+    query: dict = {"user_id": user_id}
+    if since:
+        query["version"] = {"$gt": since}
+
+    cursor = db[JOBS_COLLECTION].find(query).sort("version", 1)
+    changed = [serialize_job(doc) async for doc in cursor]
+
+    deleted = []
+    if since:
+        cursor = db[JOB_TOMBSTONES_COLLECTION].find(
+            {"user_id": user_id, "version": {"$gt": since}}, {"_id": 1}
+        )
+        deleted = [doc["_id"] async for doc in cursor]
+
+    return SyncOut(version=version, changed=changed, deleted=deleted)
+
+@router.post("/archive/{job_id}/restore", response_model=JobOut)
+async def restore_archived_job(
+    job_id: str,
+    db=Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Move an archived job back into the active job list."""
+    doc = await restore_job(db, job_id, current_user["sub"])
+    if not doc:
+        raise HTTPException(status_code=404, detail="Archived job not found")
+    return serialize_job(doc)
+
 @router.get("/{job_id}", response_model=JobOut)
 async def get_job(
     job_id: str,
@@ -135,6 +488,21 @@ async def get_job(
         raise HTTPException(status_code=404, detail="Job not found")
     return serialize_job(doc)
 
+@router.get("/{job_id}/description", response_model=JobDescriptionOut)
+async def get_job_description(
+    job_id: str,
+    db=Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Get the full description saved with a job."""
+    doc = await db[JOBS_COLLECTION].find_one(
+        {"_id": job_id, "user_id": current_user["sub"]}, {"description_hash": 1}
+    )
+    if not doc:
+        raise HTTPException(status_code=404, detail="Job not found")
+    description = await load_description(db, doc.get("description_hash"))
+    return JobDescriptionOut(job_id=job_id, description=description)
+
 @router.put("/{job_id}", response_model=JobOut)
 async def update_job(
     job_id: str,
@@ -143,19 +511,45 @@ async def update_job(
     current_user=Depends(get_current_user),
 ):
     """Update an existing job application."""
-    # Use model_dump (Pydantic v2) instead of deprecated dict()
-    update_data = {k: v for k, v in job.model_dump(exclude_unset=True).items()}
+    update_data = job_patch(job)
     update_data["updated_at"] = datetime.utcnow()
 
-    result = await db[JOBS_COLLECTION].find_one_and_update(
-        {"_id": job_id, "user_id": current_user["sub"]},
-        {"$set": update_data},
-        return_document=ReturnDocument.AFTER,
-    )
+    description = None
+    if "description" in update_data:
+        description = (update_data.pop("description") or "").strip()
+
+    descriptions: dict[str, str] = {}
+    if description is not None or SCORED_FIELDS & update_data.keys():
+        # Rescore in the same write so the stored score never lags the job
+        current = await db[JOBS_COLLECTION].find_one(
+            {"_id": job_id, "user_id": current_user["sub"]},
+            {field: 1 for field in SCORED_FIELDS},
+        )
+        if not current:
+            raise HTTPException(status_code=404, detail="Job not found")
+        if description is not None:
+            # Only stored once the job is known to exist and belong to the user
+            update_data["description_hash"] = await store_description(db, description)
+            if description:
+                descriptions[update_data["description_hash"]] = description
+        scored = {**current, **update_data}
+        await score_jobs(db, current_user["sub"], [scored], descriptions)
+        update_data["fit_score"] = scored["fit_score"]
+        update_data["fit_resume"] = scored["fit_resume"]
+
+    async with reserve_versions(db, current_user["sub"]) as version:
+        update_data["version"] = version
+        result = await db[JOBS_COLLECTION].find_one_and_update(
+            {"_id": job_id, "user_id": current_user["sub"]},
+            {"$set": update_data},
+            return_document=ReturnDocument.AFTER,
+        )
 
     if not result:
         raise HTTPException(status_code=404, detail="Job not found")
 
+    user_indexes.apply_upsert(current_user["sub"], result)
+    await cache.invalidate_user(current_user["sub"])
     return serialize_job(result)
 
 @router.delete("/{job_id}")
@@ -169,6 +563,9 @@ async def delete_job(
     )
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Job not found")
+    version = await add_tombstones(db, current_user["sub"], [job_id])
+    user_indexes.apply_delete(current_user["sub"], job_id, version)
+    await cache.invalidate_user(current_user["sub"])
     return {"detail": "Deleted"}
 
 
@@ -181,11 +578,18 @@ async def get_calendar_events(
 ):
     """Get all jobs with interview dates for calendar view."""
     user_id = current_user["sub"]
+    return await cache.get_user_cached(
+        user_id, f"calendar:{month}:{year}", lambda: _calendar_events(db, user_id, month, year)
+    )
+
+
+async def _calendar_events(db, user_id: str, month: Optional[int], year: Optional[int]) -> dict:
 
     query = {
         "user_id": user_id,
         "interview_date": {"$ne": None}
     }
+    start_date = end_date = None
 
     # Filter by month/year if provided
     if month and year:
@@ -198,16 +602,21 @@ async def get_calendar_events(
             "$lte": end_date
         }
 
-    cursor = db[JOBS_COLLECTION].find(query).sort("interview_date", 1)
+    index = await job_index.get_user_index(db, user_id)
+    if index is not None:
+        docs = index.interviews(start_date, end_date)
+    else:
+        docs = await db[JOBS_COLLECTION].find(query).sort("interview_date", 1).to_list(None)
 
     events = []
-    async for doc in cursor:
+    for doc in docs:
         events.append({
             "id": doc["_id"],
             "job_id": doc["_id"],
             "company": doc["company"],
             "role": doc["role"],
             "interview_date": doc["interview_date"].isoformat() if doc.get("interview_date") else None,
+            "interview_duration_minutes": doc.get("interview_duration_minutes"),
             "interview_type": doc.get("interview_type"),
             "interview_notes": doc.get("interview_notes"),
             "status": doc["status"],
@@ -215,3 +624,41 @@ async def get_calendar_events(
         })
 
     return {"events": events}
+
+
+@router.get("/calendar/conflicts", response_model=InterviewScheduleOut)
+async def get_interview_conflicts(
+    start: datetime,
+    end: datetime,
+    min_free_minutes: int = Query(30, ge=1),
+    db=Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """
+    Overlapping interviews and free slots between `start` and `end`.
+
+    Interviews without a duration count as DEFAULT_INTERVIEW_MINUTES long.
+    Free slots shorter than `min_free_minutes` are left out.
+    """
+    start, end = interviews.naive_utc(start), interviews.naive_utc(end)
+    if end <= start:
+        raise HTTPException(status_code=400, detail="end must be after start")
+
+    index = await interviews.get_user_index(db, current_user["sub"])
+    slots = index.overlapping(start, end)
+    conflicts = [
+        InterviewConflict(first=InterviewSlot(**first), second=InterviewSlot(**second))
+        for first, second in interviews.find_conflicts(slots)
+    ]
+    min_length = timedelta(minutes=min_free_minutes)
+    free_slots = [
+        FreeSlot(start=slot_start, end=slot_end)
+        for slot_start, slot_end in interviews.find_free_slots(slots, start, end, min_length)
+    ]
+    return InterviewScheduleOut(
+        start=start,
+        end=end,
+        interviews=len(slots),
+        conflicts=conflicts,
+        free_slots=free_slots,
+    )
@@ -0,0 +1,155 @@
+# server/app/routers/resume_routes.py
+"""
+Resume management API routes.
+Resumes are stored per user and matched to jobs by name (resume_version).
+"""
+from datetime import datetime
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from ..database import get_db
+from ..models import RESUMES_COLLECTION
+from ..schemas import ResumeCreate, ResumeOut
+from ..deps import get_current_user
+from ..scoring import text_hash, schedule_rescore
+from ..extraction import upload_extension, save_upload, extract_text_cached, discard_upload
+
+router = APIRouter(prefix="/resumes", tags=["resumes"])
+
+# Tries of a resume save that races another save of the same user
+_SAVE_ATTEMPTS = 3
+
+
+def serialize_resume(doc: dict) -> ResumeOut:
+    """Convert MongoDB document to ResumeOut schema."""
+    return ResumeOut(
+        id=str(doc["_id"]),
+        name=doc["name"],
+        is_default=doc.get("is_default", False),
+        text_length=len(doc["text"]),
+        created_at=doc["created_at"],
+        updated_at=doc["updated_at"],
+    )
+
+
+async def save_resume(db, user_id: str, name: str, text: str, is_default: bool) -> dict:
+    """
+    Create or replace a resume by name and rescore the jobs it affects.
+
+    The resume is upserted on (user_id, name), so concurrent saves of one
+    name update the same document. Rescoring runs in the background and
+    is skipped when neither the text nor the default flag changed.
+    """
+    resumes = db[RESUMES_COLLECTION]
+    now = datetime.utcnow()
+    new_id = str(ObjectId())
+    new_hash = text_hash(text)
+    fields = {
+        "user_id": user_id,
+        "name": name,
+        "text": text,
+        "text_hash": new_hash,
+        "is_default": is_default,
+        "updated_at": now,
+    }
+
+    replaced_defaults = set()
+    for attempt in range(_SAVE_ATTEMPTS):
+        if is_default:
+            # A unique index allows one default per user, so clear the old one first
+            previous_default = await resumes.find_one_and_update(
+                {"user_id": user_id, "is_default": True, "name": {"$ne": name}},
+                {"$set": {"is_default": False}},
+            )
+            if previous_default:
+                replaced_defaults.add(previous_default["name"])
+        try:
+            existing = await resumes.find_one_and_update(
+                {"user_id": user_id, "name": name},
+                {"$set": fields, "$setOnInsert": {"_id": new_id, "created_at": now}},
+                upsert=True,
+                return_document=ReturnDocument.BEFORE,
+            )
+            break
+        except DuplicateKeyError:
+            # A concurrent save inserted this name or set another default
+            if attempt == _SAVE_ATTEMPTS - 1:
+                raise HTTPException(status_code=409, detail="Resume was saved concurrently; try again")
+
+    for previous_name in replaced_defaults:
+        # Jobs that fell back to the old default now use this one
+        schedule_rescore(db, user_id, previous_name, is_default=False)
+
+    changed = (
+        not existing
+        or existing.get("text_hash") != new_hash
+        or existing.get("is_default", False) != is_default
+    )
+    if changed:
+        schedule_rescore(db, user_id, name, is_default=is_default)
+
+    if existing:
+        return {**fields, "_id": existing["_id"], "created_at": existing["created_at"]}
+    return {**fields, "_id": new_id, "created_at": now}
+
+
+@router.post("/", response_model=ResumeOut)
+async def upsert_resume(
+    resume: ResumeCreate,
+    db=Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Create or replace a resume. Fit scores of affected jobs are updated in the background."""
+    doc = await save_resume(
+        db, current_user["sub"], resume.name, resume.text, resume.is_default
+    )
+    return serialize_resume(doc)
+
+
+@router.post("/upload", response_model=ResumeOut)
+async def upload_resume(
+    file: UploadFile = File(...),
+    name: str = Form(..., min_length=1, max_length=100),
+    is_default: bool = Form(False),
+    db=Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Upload a PDF or DOCX resume. Its text is extracted and saved under `name`."""
+    extension = upload_extension(file)
+    path, content_hash = await save_upload(file, extension)
+    try:
+        text = await extract_text_cached(db, path, extension, content_hash)
+    finally:
+        discard_upload(path)
+    if len(text.strip()) < 10:
+        raise HTTPException(status_code=422, detail="No text found in resume file")
+
+    doc = await save_resume(db, current_user["sub"], name, text, is_default)
+    return serialize_resume(doc)
+
+
+@router.get("/", response_model=List[ResumeOut])
+async def list_resumes(
+    db=Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    cursor = db[RESUMES_COLLECTION].find({"user_id": current_user["sub"]}).sort("name", 1)
+    return [serialize_resume(doc) async for doc in cursor]
+
+
+@router.delete("/{name}")
+async def delete_resume(
+    name: str,
+    db=Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    user_id = current_user["sub"]
+    doc = await db[RESUMES_COLLECTION].find_one_and_delete({"user_id": user_id, "name": name})
+    if not doc:
+        raise HTTPException(status_code=404, detail="Resume not found")
+    schedule_rescore(db, user_id, name, is_default=doc.get("is_default", False))
+    return {"detail": "Deleted"}
@@ -4,7 +4,7 @@ Pydantic schemas for request/response validation.
 Defines data models for users, jobs, and AI features.
 """
 from datetime import datetime
-from typing import Optional, Literal, Dict
+from typing import Optional, Literal, Dict, List
 from pydantic import BaseModel, EmailStr, Field
 
 
@@ -96,6 +96,7 @@ class JobBase(BaseModel):
     notes: Optional[str] = Field(None, max_length=5000)
     resume_version: Optional[str] = Field(None, max_length=100)
     interview_date: Optional[datetime] = None
+    interview_duration_minutes: Optional[int] = Field(None, ge=1, le=24 * 60)
     interview_type: Optional[str] = Field(None, max_length=100)  # "phone", "video", "onsite"
     interview_notes: Optional[str] = Field(None, max_length=2000)
     reminder_sent: bool = False
@@ -103,7 +104,30 @@ class JobBase(BaseModel):
 
 class JobCreate(JobBase):
     """Schema for creating a new job application."""
-    pass
+    # Full posting text; stored separately and referenced by description_hash
+    description: Optional[str] = Field(None, max_length=100_000)
+
+
+class JobBulkItem(JobCreate):
+    """A job captured offline, tagged with a client-generated idempotency key."""
+    idempotency_key: str = Field(..., min_length=1, max_length=100)
+
+
+class JobBulkCreate(BaseModel):
+    """Schema for creating several jobs in one request."""
+    jobs: List[JobBulkItem] = Field(..., min_length=1, max_length=100)
+
+
+class JobBulkResult(BaseModel):
+    """Outcome of one item of a bulk create."""
+    idempotency_key: str
+    id: str
+    created: bool  # False if the key was already saved earlier
+
+
+class JobBulkResponse(BaseModel):
+    """Response schema for bulk job creation."""
+    results: List[JobBulkResult]
 
 
 class JobUpdate(BaseModel):
@@ -116,9 +140,42 @@ class JobUpdate(BaseModel):
     notes: Optional[str] = Field(None, max_length=5000)
     resume_version: Optional[str] = Field(None, max_length=100)
     interview_date: Optional[datetime] = None
+    interview_duration_minutes: Optional[int] = Field(None, ge=1, le=24 * 60)
     interview_type: Optional[str] = Field(None, max_length=100)
     interview_notes: Optional[str] = Field(None, max_length=2000)
     reminder_sent: Optional[bool] = None
+    description: Optional[str] = Field(None, max_length=100_000)
+
+
+class JobBatchFilter(BaseModel):
+    """Filter selecting jobs for a batch operation (same fields as list_jobs)."""
+    status: Optional[JobStatus] = None
+    platform: Optional[JobPlatform] = None
+    company: Optional[str] = None
+    date_from: Optional[datetime] = None
+    date_to: Optional[datetime] = None
+
+
+class JobBatchRequest(BaseModel):
+    """Update or delete many jobs, selected by IDs or by a filter."""
+    action: Literal["update", "delete"]
+    ids: Optional[List[str]] = Field(None, min_length=1, max_length=1000)
+    filter: Optional[JobBatchFilter] = None
+    # A filter with no criteria matches every job; it must be confirmed with all=true
+    all: bool = False
+    patch: Optional[JobUpdate] = None  # required for "update"
+
+
+class JobBatchResult(BaseModel):
+    """Outcome of a batch operation for one job."""
+    id: str
+    status: Literal["updated", "deleted", "not_found"]
+
+
+class JobBatchResponse(BaseModel):
+    """Response schema for batch operations."""
+    matched: int
+    results: List[JobBatchResult]
 
 
 class JobOut(JobBase):
@@ -127,6 +184,17 @@ class JobOut(JobBase):
     user_id: str
     created_at: datetime
     updated_at: datetime
+    archived: bool = False
+    version: int = 0
+    fit_score: Optional[float] = None
+    description_hash: Optional[str] = None
+
+
+class SyncOut(BaseModel):
+    """Jobs changed and deleted since a client's last synced version."""
+    version: int
+    changed: List[JobOut]
+    deleted: List[str]
 
 
 class StatsOut(BaseModel):
@@ -136,6 +204,27 @@ class StatsOut(BaseModel):
     platform_counts: Dict[str, int]
 
 
+# =============================================================================
+# Resume Schemas
+# =============================================================================
+
+class ResumeCreate(BaseModel):
+    """Schema for creating or replacing a resume. `name` matches JobBase.resume_version."""
+    name: str = Field(..., min_length=1, max_length=100)
+    text: str = Field(..., min_length=10)
+    is_default: bool = False
+
+
+class ResumeOut(BaseModel):
+    """Resume information returned to frontend (without the full text)."""
+    id: str
+    name: str
+    is_default: bool
+    text_length: int
+    created_at: datetime
+    updated_at: datetime
+
+
 # =============================================================================
 # AI Feature Schemas
 # =============================================================================
@@ -156,6 +245,18 @@ class AICompareRequest(BaseModel):
     resume_text: str = Field(..., min_length=10)
 
 
+class AIJobCompareRequest(BaseModel):
+    """Request schema for comparing a saved job's description with a resume."""
+    # Defaults to the job's resume (or the default resume) when omitted
+    resume_text: Optional[str] = Field(None, min_length=10)
+
+
+class JobDescriptionOut(BaseModel):
+    """Full description of a saved job."""
+    job_id: str
+    description: Optional[str] = None
+
+
 class AICompareResponse(BaseModel):
     """Response schema for AI resume comparison."""
     score: float = Field(..., ge=0, le=100)
@@ -172,6 +273,7 @@ class InterviewEvent(BaseModel):
     company: str
     role: str
     interview_date: datetime
+    interview_duration_minutes: Optional[int] = None
     interview_type: Optional[str] = None
     interview_notes: Optional[str] = None
 
@@ -190,3 +292,34 @@ class EmailReminderResponse(BaseModel):
 class CalendarEventsResponse(BaseModel):
     """Response schema for calendar events."""
     events: list[InterviewEvent]
+
+
+class InterviewSlot(BaseModel):
+    """An interview as a time interval."""
+    job_id: str
+    company: str
+    role: str
+    interview_type: Optional[str] = None
+    start: datetime
+    end: datetime
+
+
+class InterviewConflict(BaseModel):
+    """Two interviews that overlap."""
+    first: InterviewSlot
+    second: InterviewSlot
+
+
+class FreeSlot(BaseModel):
+    """A gap between interviews."""
+    start: datetime
+    end: datetime
+
+
+class InterviewScheduleOut(BaseModel):
+    """Conflicts and free slots for a date range."""
+    start: datetime
+    end: datetime
+    interviews: int
+    conflicts: list[InterviewConflict]
+    free_slots: list[FreeSlot]
@@ -0,0 +1,182 @@
+# server/app/scoring.py
+"""
+Resume-to-job fit scoring.
+
+Each job stores a precomputed `fit_score` against the resume it was
+applied with (`resume_version`, matched by resume name) or the user's
+default resume, plus `fit_resume`, the name of the resume that score
+came from. When a resume changes, only the jobs that used it are
+rescored, in throttled background batches.
+"""
+import asyncio
+import hashlib
+from typing import Optional
+
+from pymongo import UpdateOne
+
+from .cache import cache
+from .config import settings
+from .models import JOBS_COLLECTION, RESUMES_COLLECTION
+from .sync import reserve_versions
+from .descriptions import load_descriptions
+from .profiling import detached_task, unwrap_db
+
+# Keep references so background tasks aren't garbage collected mid-run
+_background_tasks: set[asyncio.Task] = set()
+
+# Passes over jobs edited concurrently with a rescore
+_RESCORE_ATTEMPTS = 3
+
+# Job fields that feed into the score
+SCORED_FIELDS = {"company", "role", "notes", "description_hash", "resume_version"}
+
+
+def fit_score(job_description: str, resume_text: str) -> float:
+    """Very naive overlap score (0-100) of job description words found in the resume."""
+    jd_words = set(job_description.lower().split())
+    cv_words = set(resume_text.lower().split())
+    overlap = len(jd_words & cv_words)
+    total = len(jd_words) or 1
+    score = min(100.0, (overlap / total) * 100 * 2)  # rough
+    return round(score, 1)
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def job_text(doc: dict, description: Optional[str] = None) -> str:
+    """Text of a job that is compared against the resume."""
+    return " ".join(filter(None, [
+        doc.get("role"), doc.get("company"), doc.get("notes"), description,
+    ]))
+
+
+async def find_resume(db, user_id: str, resume_version: Optional[str]) -> Optional[dict]:
+    """Return the resume named `resume_version`, falling back to the user's default."""
+    if resume_version:
+        resume = await db[RESUMES_COLLECTION].find_one(
+            {"user_id": user_id, "name": resume_version}
+        )
+        if resume:
+            return resume
+    return await db[RESUMES_COLLECTION].find_one({"user_id": user_id, "is_default": True})
+
+
+def score_fields(doc: dict, resume: Optional[dict], description: Optional[str] = None) -> dict:
+    """Return the fit fields to store on a job document."""
+    if not resume:
+        return {"fit_score": None, "fit_resume": None}
+    return {
+        "fit_score": fit_score(job_text(doc, description), resume["text"]),
+        "fit_resume": resume["name"],
+    }
+
+
+async def score_jobs(
+    db, user_id: str, docs: list[dict], descriptions: Optional[dict[str, str]] = None
+):
+    """
+    Set the fit fields on job documents about to be written.
+
+    Each distinct resume is looked up once per call. Descriptions not
+    passed in `descriptions` (hash -> text) are loaded in one query.
+    """
+    descriptions = dict(descriptions or {})
+    missing = [
+        doc["description_hash"] for doc in docs
+        if doc.get("description_hash") and doc["description_hash"] not in descriptions
+    ]
+    descriptions.update(await load_descriptions(db, missing))
+
+    resumes: dict[Optional[str], Optional[dict]] = {}
+    for doc in docs:
+        resume_version = doc.get("resume_version")
+        if resume_version not in resumes:
+            resumes[resume_version] = await find_resume(db, user_id, resume_version)
+        description = descriptions.get(doc.get("description_hash"))
+        doc.update(score_fields(doc, resumes[resume_version], description))
+
+
+async def rescore_jobs_for_resume(db, user_id: str, name: str, is_default: bool) -> int:
+    """
+    Rescore the jobs affected by a change to resume `name`.
+
+    Affected jobs are those scored against it, those that name it as their
+    resume_version, and (for the default resume) those with no score yet.
+    Returns the number of jobs rescored.
+    """
+    affected = [{"fit_resume": name}, {"resume_version": name}]
+    if is_default:
+        affected.append({"fit_resume": None})
+    query = {"user_id": user_id, "$or": affected}
+    projection = {field: 1 for field in SCORED_FIELDS} | {"version": 1}
+
+    total = 0
+    last_id = ""
+    changed: list[str] = []
+    while True:
+        # Page by _id so rescored jobs aren't picked up again
+        docs = await db[JOBS_COLLECTION].find(
+            {**query, "_id": {"$gt": last_id}}, projection
+        ).sort("_id", 1).limit(settings.rescore_batch_size).to_list(None)
+        if not docs:
+            break
+        changed += await _rescore_batch(db, user_id, docs)
+        total += len(docs)
+        last_id = docs[-1]["_id"]
+        await asyncio.sleep(settings.rescore_batch_pause_seconds)
+
+    # Jobs edited while being scored are scored again from their new state
+    for _ in range(_RESCORE_ATTEMPTS):
+        if not changed:
+            break
+        docs = await db[JOBS_COLLECTION].find(
+            {**query, "_id": {"$in": changed}}, projection
+        ).to_list(None)
+        changed = await _rescore_batch(db, user_id, docs) if docs else []
+    return total
+
+
+async def _rescore_batch(db, user_id: str, docs: list[dict]) -> list[str]:
+    """
+    Score and save a batch of jobs.
+
+    Each write is conditional on the version the score was computed from,
+    so a concurrent edit never gets a stale score. Returns the IDs of jobs
+    skipped that way.
+    """
+    await score_jobs(db, user_id, docs)
+    async with reserve_versions(db, user_id, len(docs)) as first_version:
+        versions = {doc["_id"]: first_version + i for i, doc in enumerate(docs)}
+        updates = [
+            UpdateOne({"_id": doc["_id"], "version": doc.get("version")}, {"$set": {
+                "fit_score": doc["fit_score"],
+                "fit_resume": doc["fit_resume"],
+                "version": versions[doc["_id"]],
+            }})
+            for doc in docs
+        ]
+        result = await db[JOBS_COLLECTION].bulk_write(updates, ordered=False)
+    await cache.invalidate_user(user_id)
+
+    if result.matched_count == len(docs):
+        return []
+    cursor = db[JOBS_COLLECTION].find({"_id": {"$in": list(versions)}}, {"version": 1})
+    return [doc["_id"] async for doc in cursor if doc.get("version") != versions[doc["_id"]]]
+
+
+def schedule_rescore(db, user_id: str, name: str, is_default: bool):
+    """Run rescore_jobs_for_resume in the background."""
+    # The task outlives the request, so keep it out of the request's profile
+    db = unwrap_db(db)
+
+    async def run():
+        try:
+            await rescore_jobs_for_resume(db, user_id, name, is_default)
+        except Exception as e:
+            print(f"Rescore error: {e}")
+
+    task = detached_task(run())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
@@ -0,0 +1,111 @@
+# server/app/sync.py
+"""
+Per-user change versions for delta sync.
+
+Every job write stamps the job with the next value of the user's
+`job_version` counter (kept on the user document). Deleted jobs leave
+a tombstone carrying the version of the delete, so `/jobs/sync` can
+return everything that changed since a client's last known version.
+
+Versions are reserved before the write lands, so a reader must not trust
+`job_version` alone: a sync that returned it while a write was still in
+flight would make the client skip that write forever. Each reservation
+is therefore recorded in `pending_versions` (atomically with the $inc)
+until the write finishes, and readers use `current_version`, which stops
+below the oldest reservation still pending.
+"""
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+
+from pymongo import ReturnDocument, UpdateOne
+
+from .config import settings
+from .models import USERS_COLLECTION, JOB_TOMBSTONES_COLLECTION
+
+
+@asynccontextmanager
+async def reserve_versions(db, user_id: str, count: int = 1):
+    """
+    Reserve `count` versions for a write and yield the first of them.
+
+    The write must happen inside the block; until the block exits, the
+    reservation holds back `current_version` so no reader can move past it.
+    Versions are allocated with a single atomic $inc, so a batch of writes
+    only costs one reservation.
+    """
+    users = db[USERS_COLLECTION]
+    # Any version allocated by the $inc below is above this one
+    floor = (await users.find_one({"_id": user_id}, {"job_version": 1}) or {}).get("job_version", 0)
+    token = uuid.uuid4().hex
+    user = await users.find_one_and_update(
+        {"_id": user_id},
+        {
+            "$inc": {"job_version": count},
+            "$push": {"pending_versions": {"token": token, "floor": floor, "at": datetime.utcnow()}},
+        },
+        projection={"job_version": 1},
+        return_document=ReturnDocument.AFTER,
+    )
+    try:
+        yield user["job_version"] - count + 1
+    finally:
+        await users.update_one({"_id": user_id}, {"$pull": {"pending_versions": {"token": token}}})
+
+
+async def current_version(db, user_id: str) -> int:
+    """
+    Return the latest version up to which every write has landed.
+
+    Reservations older than SYNC_RESERVATION_TIMEOUT_SECONDS (left by a
+    crashed process) are ignored and pruned.
+    """
+    users = db[USERS_COLLECTION]
+    user = await users.find_one({"_id": user_id}, {"job_version": 1, "pending_versions": 1}) or {}
+    version = user.get("job_version", 0)
+    cutoff = datetime.utcnow() - timedelta(seconds=settings.sync_reservation_timeout_seconds)
+
+    stale = False
+    for pending in user.get("pending_versions", []):
+        if pending["at"] < cutoff:
+            stale = True
+        else:
+            version = min(version, pending["floor"])
+    if stale:
+        await users.update_one(
+            {"_id": user_id}, {"$pull": {"pending_versions": {"at": {"$lt": cutoff}}}}
+        )
+    return version
+
+
+async def add_tombstones(
+    db, user_id: str, job_ids: list[str], reason: str = "deleted"
+) -> int:
+    """
+    Record tombstones for removed jobs, each with its own version.
+
+    Returns the version of the first tombstone.
+    """
+    if not job_ids:
+        return 0
+    now = datetime.utcnow()
+    async with reserve_versions(db, user_id, len(job_ids)) as first:
+        await db[JOB_TOMBSTONES_COLLECTION].bulk_write([
+            UpdateOne(
+                {"_id": job_id},
+                {"$set": {
+                    "user_id": user_id,
+                    "version": first + i,
+                    "reason": reason,
+                    "deleted_at": now,
+                }},
+                upsert=True,
+            )
+            for i, job_id in enumerate(job_ids)
+        ])
+    return first
+
+
+async def clear_tombstone(db, job_id: str):
+    """Drop the tombstone of a job that exists again (e.g. restored from archive)."""
+    await db[JOB_TOMBSTONES_COLLECTION].delete_one({"_id": job_id})
@@ -0,0 +1,106 @@
+# server/app/user_indexes.py
+"""
+Per-user LRU of in-memory indexes stamped with the user's job version.
+
+job_index and interviews each keep one IndexStore. MongoDB stays the
+source of truth: a read compares the cached index with the user's
+`job_version` (see sync.py) and rebuilds it on mismatch, so writes made
+by other processes or background tasks are never missed. Writes made
+through jobs_routes are applied in place with the module-level
+apply_upsert/apply_delete/invalidate, which fan out to every store.
+
+An index is any object with a `version` attribute and `upsert(doc)` /
+`remove(job_id)` methods.
+"""
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional
+
+from .sync import current_version
+
+_stores: list["IndexStore"] = []
+
+
+class IndexStore:
+    """
+    LRU of one index type, evicted by a total cost budget.
+
+    `load(db, user_id)` fetches the documents to index, and
+    `build(version, docs)` returns the index, or None to serve that user
+    from Mongo instead. `cost(index)` and `budget()` bound the store;
+    the most recently used index is always kept.
+    """
+
+    def __init__(
+        self,
+        load: Callable[[Any, str], Awaitable[list[dict]]],
+        build: Callable[[int, list[dict]], Optional[Any]],
+        budget: Callable[[], int],
+        cost: Callable[[Any], int] = lambda index: 1,
+    ):
+        self.load = load
+        self.build = build
+        self.budget = budget
+        self.cost = cost
+        self.indexes: "OrderedDict[str, Any]" = OrderedDict()
+        self.total = 0
+        _stores.append(self)
+
+    def _store(self, user_id: str, index: Optional[Any]):
+        """Replace a user's index and evict least recently used ones over budget."""
+        old = self.indexes.pop(user_id, None)
+        if old is not None:
+            self.total -= self.cost(old)
+        if index is None:
+            return
+        self.indexes[user_id] = index
+        self.total += self.cost(index)
+        while self.total > self.budget() and len(self.indexes) > 1:
+            _, evicted = self.indexes.popitem(last=False)
+            self.total -= self.cost(evicted)
+
+    async def get(self, db, user_id: str) -> Optional[Any]:
+        """Return an up-to-date index for the user, loading it if needed."""
+        version = await current_version(db, user_id)
+        index = self.indexes.get(user_id)
+        if index is not None and index.version == version:
+            self.indexes.move_to_end(user_id)
+            return index
+
+        index = self.build(version, await self.load(db, user_id))
+        self._store(user_id, index)
+        return index
+
+    def apply(self, user_id: str, version: int, change: Callable[[Any], None]):
+        """Apply the write that produced `version` in place."""
+        index = self.indexes.get(user_id)
+        if index is None:
+            return
+        if index.version != version - 1:
+            # Missed a write somewhere; reload on the next read
+            self._store(user_id, None)
+            return
+        before = self.cost(index)
+        change(index)
+        index.version = version
+        self.total += self.cost(index) - before
+
+    def invalidate(self, user_id: str):
+        self._store(user_id, None)
+
+
+def invalidate(user_id: str):
+    """Drop a user's indexes, e.g. after a batch write; they reload on next read."""
+    for store in _stores:
+        store.invalidate(user_id)
+
+
+def apply_upsert(user_id: str, doc: dict):
+    """Apply a created or updated job (carrying its new version) in place."""
+    for store in _stores:
+        store.apply(user_id, doc["version"], lambda index: index.upsert(doc))
+
+
+def apply_delete(user_id: str, job_id: str, version: int):
+    """Apply a deleted job in place."""
+    for store in _stores:
+        store.apply(user_id, version, lambda index: index.remove(job_id))
@@ -0,0 +1,122 @@
+# server/benchmarks/bench_interview_index.py
+"""
+Benchmark for the interview interval index (app/interviews.py).
+
+Runs in-process, no server or database needed (run from server/ so the
+app settings load from .env):
+
+    python benchmarks/bench_interview_index.py --count 50000 --queries 2000
+
+Builds an index of `count` interviews spread over a few years, then
+measures in-place updates and conflict/free-slot queries for one-week
+windows, compared with a linear scan over all interviews.
+"""
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.interviews import InterviewIndex, find_conflicts, find_free_slots, interview_span  # noqa: E402
+
+EPOCH = datetime(2026, 1, 1)
+SPAN_DAYS = 3 * 365
+
+
+def make_docs(count: int, rng: random.Random) -> list[dict]:
+    docs = []
+    for i in range(count):
+        start = EPOCH + timedelta(minutes=15 * rng.randrange(SPAN_DAYS * 96))
+        docs.append({
+            "_id": f"{i:024x}",
+            "company": f"Company {i % 500}",
+            "role": "Engineer",
+            "interview_date": start,
+            "interview_duration_minutes": rng.choice([30, 45, 60, 90, 240]),
+            "interview_type": "Video",
+        })
+    return docs
+
+
+def linear_overlapping(docs: list[dict], start: datetime, end: datetime) -> list[dict]:
+    """Baseline: check every interview, then sort the matches."""
+    slots = []
+    for doc in docs:
+        span_start, span_end = interview_span(doc)
+        if span_start < end and span_end > start:
+            slots.append({"job_id": doc["_id"], "start": span_start, "end": span_end})
+    slots.sort(key=lambda s: (s["start"], s["job_id"]))
+    return slots
+
+
+def timed(fn, repeat: int) -> float:
+    """Mean milliseconds per call."""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) * 1000 / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--count", type=int, default=50_000, help="interviews in the index")
+    parser.add_argument("--queries", type=int, default=2_000, help="range queries to run")
+    parser.add_argument("--updates", type=int, default=5_000, help="in-place updates to run")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    docs = make_docs(args.count, rng)
+
+    started = time.perf_counter()
+    index = InterviewIndex(0, docs)
+    print(f"build       {args.count} interviews in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    windows = []
+    for _ in range(args.queries):
+        start = EPOCH + timedelta(hours=rng.randrange(SPAN_DAYS * 24))
+        windows.append((start, start + timedelta(days=7)))
+
+    # Check against the baseline before timing
+    for start, end in windows[:50]:
+        expected = [slot["job_id"] for slot in linear_overlapping(docs, start, end)]
+        assert [slot["job_id"] for slot in index.overlapping(start, end)] == expected
+
+    min_length = timedelta(minutes=30)
+    found = {"slots": 0, "conflicts": 0}
+
+    def indexed_query():
+        start, end = windows[rng.randrange(len(windows))]
+        slots = index.overlapping(start, end)
+        found["slots"] += len(slots)
+        found["conflicts"] += len(find_conflicts(slots))
+        find_free_slots(slots, start, end, min_length)
+
+    def linear_query():
+        start, end = windows[rng.randrange(len(windows))]
+        slots = linear_overlapping(docs, start, end)
+        find_conflicts(slots)
+        find_free_slots(slots, start, end, min_length)
+
+    indexed_ms = timed(indexed_query, args.queries)
+    print(
+        f"query       {indexed_ms * 1000:.1f} us/week "
+        f"(avg {found['slots'] / args.queries:.1f} interviews, "
+        f"{found['conflicts'] / args.queries:.1f} conflicts)"
+    )
+    linear_ms = timed(linear_query, max(1, args.queries // 100))
+    print(f"linear scan {linear_ms * 1000:.1f} us/week ({linear_ms / indexed_ms:.0f}x slower)")
+
+    def update():
+        doc = dict(docs[rng.randrange(len(docs))])
+        doc["interview_date"] = EPOCH + timedelta(minutes=15 * rng.randrange(SPAN_DAYS * 96))
+        index.upsert(doc)
+
+    print(f"update      {timed(update, args.updates) * 1000:.1f} us/write")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# server/benchmarks/bench_resume_upload.py
+"""
+Throughput benchmark for concurrent resume uploads.
+
+Runs against a live server:
+
+    uvicorn app.main:app --port 8001 --workers 1
+    pip install httpx
+    python benchmarks/bench_resume_upload.py --count 200 --concurrency 16
+
+Two rounds are measured: unique files (every upload is extracted in the
+process pool) and the same file re-uploaded (served from the text cache).
+"""
+import argparse
+import asyncio
+import io
+import time
+import uuid
+import zipfile
+
+import httpx
+
+DOCUMENT_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    "<w:body>{paragraphs}</w:body></w:document>"
+)
+
+
+def make_docx(seed: str, paragraphs: int = 400) -> bytes:
+    """Build a minimal DOCX file with unique text."""
+    body = "".join(
+        f"<w:p><w:r><w:t>{seed} python fastapi mongodb react line {i}</w:t></w:r></w:p>"
+        for i in range(paragraphs)
+    )
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("word/document.xml", DOCUMENT_XML.format(paragraphs=body))
+    return buffer.getvalue()
+
+
+async def get_token(client: httpx.AsyncClient, email: str, password: str) -> str:
+    res = await client.post("/auth/register", json={"email": email, "password": password})
+    if res.status_code != 200:
+        res = await client.post("/auth/login", json={"email": email, "password": password})
+    res.raise_for_status()
+    return res.json()["access_token"]
+
+
+async def run_round(client, token, files: list[bytes], concurrency: int) -> tuple[float, int]:
+    slots = asyncio.Semaphore(concurrency)
+    failures = 0
+
+    async def upload(i: int, content: bytes):
+        nonlocal failures
+        async with slots:
+            res = await client.post(
+                "/resumes/upload",
+                headers={"Authorization": f"Bearer {token}"},
+                files={"file": (f"resume-{i}.docx", content)},
+                data={"name": f"bench-{i % 20}"},
+            )
+            if res.status_code != 200:
+                failures += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(upload(i, content) for i, content in enumerate(files)))
+    return time.perf_counter() - start, failures
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="http://localhost:8001")
+    parser.add_argument("--count", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--email", default=f"bench-{uuid.uuid4().hex[:8]}@example.com")
+    parser.add_argument("--password", default="benchmark-password")
+    args = parser.parse_args()
+
+    async with httpx.AsyncClient(base_url=args.url, timeout=60) as client:
+        token = await get_token(client, args.email, args.password)
+
+        unique = [make_docx(uuid.uuid4().hex) for _ in range(args.count)]
+        same = [make_docx("cached")] * args.count
+
+        for label, files in (("unique files", unique), ("same file", same)):
+            elapsed, failures = await run_round(client, token, files, args.concurrency)
+            print(
+                f"{label:>12}: {args.count} uploads in {elapsed:.2f}s "
+                f"({args.count / elapsed:.1f}/s, {failures} failed)"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
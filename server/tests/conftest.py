@@ -0,0 +1,75 @@
+# server/tests/conftest.py
+"""
+Shared fixtures. Run from server/:
+
+    python -m pytest -q
+
+Tests use an in-memory Mongo (mongomock-motor) and need no server.
+"""
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Settings without defaults, for runs without a .env
+for name, value in {
+    "MONGODB_URI": "mongodb://localhost:27017",
+    "MONGODB_DB_NAME": "job_tracker_test",
+    "JWT_SECRET": "test-secret",
+    "JWT_ALGORITHM": "HS256",
+    "JWT_EXPIRES_MINUTES": "60",
+    "SMTP_SERVER": "localhost",
+    "SMTP_PORT": "25",
+    "EMAIL_FROM": "test@example.com",
+    "EMAIL_PASSWORD": "",
+}.items():
+    os.environ.setdefault(name, value)
+# No background tasks during tests
+os.environ["ARCHIVE_ENABLED"] = "false"
+os.environ["DESCRIPTION_SWEEP_ENABLED"] = "false"
+
+import mongomock.collection  # noqa: E402
+from mongomock_motor import AsyncMongoMockClient  # noqa: E402
+
+# pymongo >= 4.11 passes `sort` to bulk updates, which mongomock 4.3 doesn't accept
+_add_update = mongomock.collection.BulkOperationBuilder.add_update
+
+
+def _add_update_without_sort(self, *args, sort=None, **kwargs):
+    return _add_update(self, *args, **kwargs)
+
+
+mongomock.collection.BulkOperationBuilder.add_update = _add_update_without_sort
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def db():
+    return AsyncMongoMockClient()["job_tracker_test"]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """API client on a fresh in-memory database."""
+    from fastapi.testclient import TestClient
+
+    from app import database
+    from app.main import app
+
+    monkeypatch.setattr(database, "client", AsyncMongoMockClient())
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def auth(client):
+    """Authorization headers for a newly registered user."""
+    response = client.post("/auth/register", json={"email": "user@example.com", "password": "secret123"})
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
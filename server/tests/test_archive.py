@@ -0,0 +1,72 @@
+# server/tests/test_archive.py
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.archive import archive_stale_jobs
+from app.config import settings
+from app.database import get_db
+
+
+@pytest.fixture
+def jobs(client, auth, monkeypatch):
+    monkeypatch.setattr(settings, "archive_batch_pause_seconds", 0)
+    statuses = ["rejected", "applied", "interview"]
+    return [
+        client.post("/jobs/", json={"company": f"Co{i}", "role": "Dev", "job_link": "x", "status": status}, headers=auth).json()
+        for i, status in enumerate(statuses)
+    ]
+
+
+def archive(client, days: int) -> int:
+    return client.portal.call(archive_stale_jobs, get_db(), datetime.utcnow() + timedelta(days=days))
+
+
+def test_archiving_is_off_by_default():
+    # Enabling it hides jobs from lists, so it must be an explicit choice
+    assert type(settings).model_fields["archive_enabled"].default is False
+
+
+def test_stale_jobs_move_out_of_the_hot_list(client, auth, jobs):
+    assert archive(client, 10) == 0
+    assert archive(client, 40) == 1  # rejected after 30 days
+    assert archive(client, 100) == 1  # applied after 90 days
+
+    hot = client.get("/jobs/", headers=auth).json()
+    assert [job["company"] for job in hot] == ["Co2"]
+
+    everything = client.get("/jobs/?include_archived=true", headers=auth).json()
+    assert sorted((job["company"], job["archived"]) for job in everything) == [
+        ("Co0", True), ("Co1", True), ("Co2", False),
+    ]
+    stats = client.get("/jobs/stats?include_archived=true", headers=auth).json()
+    assert stats["total_applications"] == 3
+
+
+def test_archived_jobs_are_tombstoned_and_restored(client, auth, jobs):
+    version = client.get("/jobs/sync", headers=auth).json()["version"]
+    archive(client, 40)
+
+    delta = client.get(f"/jobs/sync?since={version}", headers=auth).json()
+    assert delta["deleted"] == [jobs[0]["id"]]
+
+    restored = client.post(f"/jobs/archive/{jobs[0]['id']}/restore", headers=auth)
+    assert restored.status_code == 200
+    assert restored.json()["archived"] is False
+
+    delta = client.get(f"/jobs/sync?since={version}", headers=auth).json()
+    assert delta["deleted"] == []
+    assert jobs[0]["id"] in [job["id"] for job in delta["changed"]]
+    assert len(client.get("/jobs/", headers=auth).json()) == 3
+
+    again = client.post(f"/jobs/archive/{jobs[0]['id']}/restore", headers=auth)
+    assert again.status_code == 404
+
+
+def test_restore_is_scoped_to_the_owner(client, auth, jobs):
+    archive(client, 40)
+    other = client.post("/auth/register", json={"email": "other@example.com", "password": "secret123"}).json()
+    headers = {"Authorization": f"Bearer {other['access_token']}"}
+
+    assert client.post(f"/jobs/archive/{jobs[0]['id']}/restore", headers=headers).status_code == 404
+    assert client.get("/jobs/?include_archived=true", headers=headers).json() == []
@@ -0,0 +1,79 @@
+# server/tests/test_batch.py
+import pytest
+
+
+@pytest.fixture
+def jobs(client, auth):
+    return [
+        client.post("/jobs/", json={
+            "company": f"Co{i}", "role": "Dev", "job_link": "x",
+            "platform": "Indeed" if i == 2 else "LinkedIn",
+        }, headers=auth).json()
+        for i in range(3)
+    ]
+
+
+def test_update_by_ids_reports_missing_jobs(client, auth, jobs):
+    response = client.post("/jobs/batch", json={
+        "action": "update",
+        "ids": [jobs[0]["id"], "000000000000000000000000"],
+        "patch": {"status": "rejected"},
+    }, headers=auth).json()
+
+    assert response["matched"] == 1
+    assert {(r["id"], r["status"]) for r in response["results"]} == {
+        (jobs[0]["id"], "updated"), ("000000000000000000000000", "not_found"),
+    }
+    assert client.get(f"/jobs/{jobs[0]['id']}", headers=auth).json()["status"] == "rejected"
+
+
+def test_update_by_filter(client, auth, jobs):
+    response = client.post("/jobs/batch", json={
+        "action": "update", "filter": {"platform": "LinkedIn"}, "patch": {"status": "offer"},
+    }, headers=auth).json()
+
+    assert response["matched"] == 2
+    statuses = {job["id"]: job["status"] for job in client.get("/jobs/", headers=auth).json()}
+    assert statuses == {jobs[0]["id"]: "offer", jobs[1]["id"]: "offer", jobs[2]["id"]: "applied"}
+
+
+def test_null_required_fields_are_rejected(client, auth, jobs):
+    response = client.post("/jobs/batch", json={
+        "action": "update", "filter": {"platform": "LinkedIn"}, "patch": {"company": None, "status": None},
+    }, headers=auth)
+    assert response.status_code == 400
+
+    response = client.put(f"/jobs/{jobs[0]['id']}", json={"role": None}, headers=auth)
+    assert response.status_code == 400
+
+    listed = client.get("/jobs/", headers=auth)
+    assert listed.status_code == 200
+    assert sorted(job["company"] for job in listed.json()) == ["Co0", "Co1", "Co2"]
+
+
+def test_null_clears_optional_fields(client, auth, jobs):
+    client.put(f"/jobs/{jobs[0]['id']}", json={"notes": "call back"}, headers=auth)
+    client.post("/jobs/batch", json={
+        "action": "update", "ids": [jobs[0]["id"]], "patch": {"notes": None},
+    }, headers=auth)
+
+    assert client.get(f"/jobs/{jobs[0]['id']}", headers=auth).json()["notes"] is None
+
+
+def test_empty_filter_needs_all(client, auth, jobs):
+    response = client.post("/jobs/batch", json={"action": "delete", "filter": {}}, headers=auth)
+    assert response.status_code == 400
+    assert len(client.get("/jobs/", headers=auth).json()) == 3
+
+    response = client.post("/jobs/batch", json={"action": "delete", "filter": {}, "all": True}, headers=auth)
+    assert response.json()["matched"] == 3
+    assert client.get("/jobs/", headers=auth).json() == []
+
+
+def test_ids_or_filter_and_patch_are_required(client, auth, jobs):
+    both = {"action": "delete", "ids": [jobs[0]["id"]], "filter": {"status": "applied"}}
+    assert client.post("/jobs/batch", json=both, headers=auth).status_code == 400
+    assert client.post("/jobs/batch", json={"action": "delete"}, headers=auth).status_code == 400
+
+    no_patch = {"action": "update", "ids": [jobs[0]["id"]]}
+    assert client.post("/jobs/batch", json=no_patch, headers=auth).status_code == 400
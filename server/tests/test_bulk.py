@@ -0,0 +1,65 @@
+# server/tests/test_bulk.py
+from app.models import JOBS_COLLECTION
+from app.routers import jobs_routes
+
+
+def capture(key: str, company: str = "Acme") -> dict:
+    return {"idempotency_key": key, "company": company, "role": "Dev", "job_link": "x", "source": "extension"}
+
+
+def test_retried_batches_are_not_inserted_again(client, auth):
+    first = client.post("/jobs/bulk", json={"jobs": [capture("k1"), capture("k2")]}, headers=auth).json()
+    assert [(r["idempotency_key"], r["created"]) for r in first["results"]] == [("k1", True), ("k2", True)]
+
+    retry = client.post("/jobs/bulk", json={"jobs": [capture("k2"), capture("k3")]}, headers=auth).json()
+    assert [(r["idempotency_key"], r["created"]) for r in retry["results"]] == [("k2", False), ("k3", True)]
+    assert retry["results"][0]["id"] == first["results"][1]["id"]
+
+    assert len(client.get("/jobs/", headers=auth).json()) == 3
+
+
+def test_repeated_keys_in_one_batch_create_one_job(client, auth):
+    response = client.post("/jobs/bulk", json={
+        "jobs": [capture("k1", "First"), capture("k1", "Second"), capture("k2")],
+    }, headers=auth).json()
+
+    assert [(r["idempotency_key"], r["created"]) for r in response["results"]] == [
+        ("k1", True), ("k1", False), ("k2", True),
+    ]
+    assert response["results"][0]["id"] == response["results"][1]["id"]
+    companies = sorted(job["company"] for job in client.get("/jobs/", headers=auth).json())
+    assert companies == ["Acme", "First"]
+
+
+def test_keys_are_scoped_per_user(client, auth):
+    client.post("/jobs/bulk", json={"jobs": [capture("k1")]}, headers=auth)
+    other = client.post("/auth/register", json={"email": "other@example.com", "password": "secret123"}).json()
+    headers = {"Authorization": f"Bearer {other['access_token']}"}
+
+    response = client.post("/jobs/bulk", json={"jobs": [capture("k1")]}, headers=headers).json()
+
+    assert response["results"][0]["created"] is True
+
+
+def test_a_concurrent_retry_is_reported_as_existing(client, auth, monkeypatch):
+    original = jobs_routes.score_jobs
+
+    async def racing(db, user_id, docs, descriptions=None):
+        # Another request saves k1 between the existing-key lookup and the insert
+        await db[JOBS_COLLECTION].insert_one({**docs[0], "_id": "raced"})
+        await original(db, user_id, docs, descriptions)
+
+    monkeypatch.setattr(jobs_routes, "score_jobs", racing)
+    response = client.post("/jobs/bulk", json={"jobs": [capture("k1"), capture("k2")]}, headers=auth).json()
+
+    assert [(r["idempotency_key"], r["id"] == "raced", r["created"]) for r in response["results"]] == [
+        ("k1", True, False), ("k2", False, True),
+    ]
+
+
+def test_invalid_items_are_reported_by_index(client, auth):
+    jobs = [capture("k1"), {**capture("k2"), "company": ""}]
+    response = client.post("/jobs/bulk", json={"jobs": jobs}, headers=auth)
+
+    assert response.status_code == 422
+    assert [error["loc"][:3] for error in response.json()["detail"]] == [["body", "jobs", 1]]
@@ -0,0 +1,96 @@
+# server/tests/test_cache.py
+import asyncio
+
+import pytest
+
+from app.cache import MemoryBackend, TwoLevelCache
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def cache():
+    return TwoLevelCache(MemoryBackend(), l1_max_entries=100, ttl=60)
+
+
+def slow_loader(calls: list, value="v", gate: asyncio.Event = None):
+    async def load():
+        calls.append(value)
+        if gate is not None:
+            await gate.wait()
+        await asyncio.sleep(0)
+        return value
+    return load
+
+
+async def test_concurrent_misses_share_one_load(cache):
+    calls = []
+    gate = asyncio.Event()
+    tasks = [asyncio.create_task(cache.get_or_load("k", slow_loader(calls, gate=gate))) for _ in range(5)]
+    await asyncio.sleep(0)
+    gate.set()
+
+    assert await asyncio.gather(*tasks) == ["v"] * 5
+    assert calls == ["v"]
+    assert cache.metrics["loads"] == 1
+    assert cache.inflight == {}
+
+
+async def test_cancelled_leader_hands_the_load_to_a_waiter(cache):
+    calls = []
+    gate = asyncio.Event()
+    leader = asyncio.create_task(cache.get_or_load("k", slow_loader(calls, "first", gate)))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(cache.get_or_load("k", slow_loader(calls, "second")))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+    assert await follower == "second"
+    assert calls == ["first", "second"]
+
+
+async def test_loader_errors_reach_every_waiter_and_are_not_cached(cache):
+    gate = asyncio.Event()
+
+    async def failing():
+        await gate.wait()
+        raise ValueError("boom")
+
+    tasks = [asyncio.create_task(cache.get_or_load("k", failing)) for _ in range(3)]
+    await asyncio.sleep(0)
+    gate.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert await cache.get_or_load("k", slow_loader([], "ok")) == "ok"
+
+
+async def test_layers_and_user_generations(cache):
+    key = await cache.user_key("u1", "stats")
+    assert await cache.get_or_load(key, slow_loader([], {"n": 1})) == {"n": 1}
+
+    # Another node: empty L1, shared L2
+    other = TwoLevelCache(cache.backend, l1_max_entries=100, ttl=60)
+    calls = []
+    assert await other.get_or_load(key, slow_loader(calls, {"n": 2})) == {"n": 1}
+    assert calls == []
+    assert other.metrics["l2_hits"] == 1
+
+    await other.invalidate_user("u1")
+    new_key = await cache.user_key("u1", "stats")
+    assert new_key != key
+    assert await cache.get_or_load(new_key, slow_loader(calls, {"n": 2})) == {"n": 2}
+
+
+async def test_pass_through_without_backend():
+    cache = TwoLevelCache(None, l1_max_entries=100, ttl=60)
+    calls = []
+
+    await cache.get_or_load("k", slow_loader(calls))
+    await cache.get_or_load("k", slow_loader(calls))
+
+    assert calls == ["v", "v"]
+    assert cache.inflight == {}
@@ -0,0 +1,103 @@
+# server/tests/test_compression.py
+import gzip
+
+import pytest
+import zstandard
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.compression import (
+    CompressedCache, CompressionMiddleware, ENCODERS, choose_encoding, compress_body, compressed_cache,
+)
+
+PAYLOAD = [{"company": f"Company {i}", "role": "Engineer", "status": "applied"} for i in range(200)]
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, min_size=1024)
+
+    @app.get("/big")
+    async def big():
+        return JSONResponse(PAYLOAD)
+
+    @app.get("/small")
+    async def small():
+        return JSONResponse({"ok": True})
+
+    @app.get("/binary")
+    async def binary():
+        return PlainTextResponse("x" * 5000, media_type="application/octet-stream")
+
+    @app.get("/stream")
+    async def stream():
+        return StreamingResponse(iter([b"x" * 2000, b"y" * 2000]), media_type="text/plain")
+
+    return TestClient(app)
+
+
+def test_choose_encoding_follows_server_preference_and_q_values():
+    assert choose_encoding("gzip, zstd") == "zstd"
+    assert choose_encoding("zstd;q=0, gzip") == "gzip"
+    assert choose_encoding("gzip;q=0.5") == "gzip"
+    assert choose_encoding("identity") is None
+    assert choose_encoding("") is None
+    assert choose_encoding("*") == next(iter(ENCODERS))
+    assert choose_encoding("*, zstd;q=0") == ("br" if "br" in ENCODERS else "gzip")
+    assert choose_encoding("gzip;q=bogus") is None
+
+
+@pytest.mark.parametrize("encoding", ["zstd", "gzip"])
+def test_large_json_is_compressed(client, encoding):
+    response = client.get("/big", headers={"Accept-Encoding": encoding})
+
+    assert response.headers["content-encoding"] == encoding
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert response.json() == PAYLOAD
+    assert int(response.headers["content-length"]) < len(response.content)
+
+
+def test_compressed_bytes_decode(client):
+    raw = client.get("/big", headers={"Accept-Encoding": "gzip"}).content
+    compressed = compress_body(raw, "gzip")
+    assert gzip.decompress(compressed) == raw
+    assert zstandard.ZstdDecompressor().decompress(compress_body(raw, "zstd")) == raw
+
+
+@pytest.mark.parametrize("path", ["/small", "/binary", "/stream"])
+def test_other_responses_pass_through(client, path):
+    response = client.get(path, headers={"Accept-Encoding": "zstd, gzip"})
+
+    assert "content-encoding" not in response.headers
+
+
+def test_no_accepted_encoding(client):
+    response = client.get("/big", headers={"Accept-Encoding": "identity"})
+
+    assert "content-encoding" not in response.headers
+    assert response.json() == PAYLOAD
+
+
+def test_identical_bodies_are_compressed_once(monkeypatch):
+    calls = []
+    monkeypatch.setitem(ENCODERS, "gzip", lambda body: calls.append(body) or gzip.compress(body))
+    compressed_cache.entries.clear()
+    compressed_cache.size = 0
+
+    body = b'{"jobs": []}' * 200
+    assert compress_body(body, "gzip") == compress_body(body, "gzip")
+    assert len(calls) == 1
+
+
+def test_cache_is_bounded_in_bytes():
+    cache = CompressedCache(max_bytes=10)
+    cache.put(("gzip", b"a"), b"12345")
+    cache.put(("gzip", b"b"), b"12345")
+    cache.get(("gzip", b"a"))
+    cache.put(("gzip", b"c"), b"123")
+    cache.put(("gzip", b"d"), b"x" * 11)
+
+    assert list(cache.entries) == [("gzip", b"a"), ("gzip", b"c")]
+    assert cache.size == 8
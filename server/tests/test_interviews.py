@@ -0,0 +1,90 @@
+# server/tests/test_interviews.py
+import random
+from datetime import datetime, timedelta, timezone
+
+from app.interviews import (
+    InterviewIndex, find_conflicts, find_free_slots, interview_span, naive_utc,
+)
+
+DAY = datetime(2026, 3, 2)
+
+
+def make_doc(job_id: str, hour: float, minutes=None) -> dict:
+    return {
+        "_id": job_id,
+        "company": "Acme",
+        "role": "Engineer",
+        "interview_date": DAY + timedelta(hours=hour),
+        "interview_duration_minutes": minutes,
+    }
+
+
+def ids(slots: list[dict]) -> list[str]:
+    return [slot["job_id"] for slot in slots]
+
+
+def test_span_uses_default_duration_and_utc():
+    doc = make_doc("a", 9)
+    assert interview_span(doc) == (DAY + timedelta(hours=9), DAY + timedelta(hours=10))
+    assert interview_span({"interview_date": None}) is None
+
+    aware = datetime(2026, 3, 2, 9, tzinfo=timezone(timedelta(hours=2)))
+    assert naive_utc(aware) == DAY + timedelta(hours=7)
+
+
+def test_overlapping_finds_long_interviews_starting_before_the_range():
+    index = InterviewIndex(1, [
+        make_doc("long", 8, minutes=240),
+        make_doc("early", 7),
+        make_doc("late", 13),
+        {"_id": "none", "company": "Acme", "role": "Engineer", "interview_date": None},
+    ])
+
+    assert len(index) == 3
+    assert ids(index.overlapping(DAY + timedelta(hours=11), DAY + timedelta(hours=12))) == ["long"]
+    # Ranges are half-open: an interview ending at `start` doesn't overlap
+    assert ids(index.overlapping(DAY + timedelta(hours=8), DAY + timedelta(hours=13))) == ["long"]
+    assert ids(index.overlapping(DAY, DAY + timedelta(days=1))) == ["early", "long", "late"]
+
+
+def test_overlapping_matches_a_linear_scan():
+    rng = random.Random(7)
+    docs = [make_doc(f"job{i}", rng.randrange(0, 24 * 14) / 2, rng.choice([30, 60, 180])) for i in range(300)]
+    index = InterviewIndex(1, docs)
+
+    for _ in range(100):
+        start = DAY + timedelta(hours=rng.randrange(0, 24 * 14))
+        end = start + timedelta(hours=rng.randrange(1, 48))
+        expected = sorted(
+            (span[0], doc["_id"]) for doc in docs
+            for span in [interview_span(doc)] if span[0] < end and span[1] > start
+        )
+        assert ids(index.overlapping(start, end)) == [job_id for _, job_id in expected]
+
+
+def test_upsert_moves_and_remove_drops():
+    index = InterviewIndex(1, [make_doc("a", 9), make_doc("b", 11)])
+
+    index.upsert(make_doc("a", 12))
+    index.upsert(make_doc("c", 10))
+    index.remove("b")
+    index.remove("missing")
+    index.upsert({"_id": "c", "company": "Acme", "role": "Engineer", "interview_date": None})
+
+    assert ids(index.overlapping(DAY, DAY + timedelta(days=1))) == ["a"]
+    assert index.keys == [(DAY + timedelta(hours=12), "a")]
+
+
+def test_conflicts_and_free_slots():
+    slots = InterviewIndex(1, [
+        make_doc("a", 9),
+        make_doc("b", 9.5),
+        make_doc("c", 10.25),
+        make_doc("d", 14),
+    ]).overlapping(DAY + timedelta(hours=8), DAY + timedelta(hours=18))
+
+    assert [(x["job_id"], y["job_id"]) for x, y in find_conflicts(slots)] == [("a", "b"), ("b", "c")]
+
+    free = find_free_slots(slots, DAY + timedelta(hours=8), DAY + timedelta(hours=18), timedelta(minutes=60))
+    hours = [((start - DAY).total_seconds() / 3600, (end - DAY).total_seconds() / 3600) for start, end in free]
+    assert hours == [(8, 9), (11.25, 14), (15, 18)]
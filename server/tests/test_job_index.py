@@ -0,0 +1,117 @@
+# server/tests/test_job_index.py
+from datetime import datetime, timedelta
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from app.job_index import STATUS_CODES, UserJobIndex  # noqa: E402
+
+START = datetime(2026, 1, 1)
+
+
+def make_doc(i: int, **fields) -> dict:
+    doc = {
+        "_id": f"job{i}",
+        "status": "applied",
+        "platform": "LinkedIn",
+        "created_at": START + timedelta(days=i),
+        "interview_date": None,
+        "fit_score": None,
+    }
+    doc.update(fields)
+    return doc
+
+
+def ids(docs: list[dict]) -> list[str]:
+    return [doc["_id"] for doc in docs]
+
+
+def assert_consistent(index: UserJobIndex):
+    """Every column row matches the document stored in it."""
+    assert index.size == len(index.rows)
+    for job_id, row in index.rows.items():
+        doc = index.docs[row]
+        assert index.ids[row] == job_id == doc["_id"]
+        assert index.status[row] == STATUS_CODES[doc["status"]]
+    assert all(index.ids[index.size:] == None)  # noqa: E711
+
+
+def test_select_filters_and_sorts_newest_first():
+    docs = [
+        make_doc(0, status="rejected"),
+        make_doc(1, platform="Indeed", fit_score=80.0),
+        make_doc(2, fit_score=40.0),
+        make_doc(3, status="offer", fit_score=90.0),
+    ]
+    index = UserJobIndex(1, docs)
+
+    assert ids(index.select()) == ["job3", "job2", "job1", "job0"]
+    assert ids(index.select(status="rejected")) == ["job0"]
+    assert ids(index.select(platform="Indeed")) == ["job1"]
+    assert ids(index.select(date_from=START + timedelta(days=1), date_to=START + timedelta(days=2))) == ["job2", "job1"]
+    # Unscored jobs never match a minimum score
+    assert ids(index.select(min_fit=0)) == ["job3", "job2", "job1"]
+    assert ids(index.select(sort="fit_score")) == ["job3", "job1", "job2", "job0"]
+    assert index.select(status="unknown") == []
+
+
+def test_remove_moves_last_row_into_the_hole():
+    docs = [make_doc(i, status="interview" if i == 4 else "applied") for i in range(5)]
+    index = UserJobIndex(1, docs)
+
+    index.remove("job1")
+
+    assert index.size == 4
+    assert index.rows["job4"] == 1
+    assert index.status[1] == index.status[index.rows["job4"]]
+    assert ids(index.select(status="interview")) == ["job4"]
+    assert ids(index.select()) == ["job4", "job3", "job2", "job0"]
+    assert_consistent(index)
+
+
+def test_remove_last_and_missing_rows():
+    index = UserJobIndex(1, [make_doc(i) for i in range(3)])
+
+    index.remove("job2")
+    index.remove("job2")
+    index.remove("nope")
+
+    assert ids(index.select()) == ["job1", "job0"]
+    assert_consistent(index)
+
+
+def test_upsert_updates_in_place_and_grows():
+    index = UserJobIndex(1, [make_doc(i) for i in range(3)])
+
+    index.upsert(make_doc(1, status="offer"))
+    for i in range(3, 40):
+        index.upsert(make_doc(i))
+
+    assert index.size == 40
+    assert len(index.ids) >= 40
+    assert ids(index.select(status="offer")) == ["job1"]
+    assert ids(index.select())[:2] == ["job39", "job38"]
+    assert_consistent(index)
+
+
+def test_counts_and_interviews():
+    docs = [
+        make_doc(0, interview_date=START + timedelta(days=10)),
+        make_doc(1, status="rejected", platform="Indeed"),
+        make_doc(2, interview_date=START + timedelta(days=5)),
+    ]
+    index = UserJobIndex(1, docs)
+
+    total, status_counts, platform_counts = index.counts()
+    assert total == 3
+    assert status_counts == {"applied": 2, "rejected": 1}
+    assert platform_counts == {"LinkedIn": 2, "Indeed": 1}
+
+    assert ids(index.interviews()) == ["job2", "job0"]
+    assert ids(index.interviews(start=START + timedelta(days=6))) == ["job0"]
+
+
+def test_unknown_status_fails_the_build():
+    with pytest.raises(KeyError):
+        UserJobIndex(1, [make_doc(0, status="ghosted")])
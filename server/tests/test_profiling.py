@@ -0,0 +1,65 @@
+# server/tests/test_profiling.py
+import asyncio
+
+import pytest
+
+from app.profiling import (
+    ProfiledDatabase, RequestProfile, current_profile, detached_task, unwrap_db,
+)
+
+pytestmark = pytest.mark.anyio
+
+DELAY = 0.05
+
+
+class MotorStyleCursor:
+    """Like Motor: to_list is a plain method returning a future."""
+
+    def sort(self, *args):
+        return self
+
+    def to_list(self, length=None):
+        future = asyncio.get_running_loop().create_future()
+        asyncio.get_running_loop().call_later(DELAY, future.set_result, [{"_id": "a"}])
+        return future
+
+
+class MotorStyleCollection:
+    def find(self, *args, **kwargs):
+        return MotorStyleCursor()
+
+    def find_one(self, *args, **kwargs):
+        future = asyncio.get_running_loop().create_future()
+        asyncio.get_running_loop().call_later(DELAY, future.set_result, {"_id": "a"})
+        return future
+
+
+@pytest.fixture
+def profile():
+    profile = RequestProfile({"method": "GET", "path": "/"})
+    token = current_profile.set(profile)
+    yield profile
+    current_profile.reset(token)
+
+
+async def test_awaits_on_motor_futures_count_as_mongo(profile):
+    db = ProfiledDatabase({"jobs": MotorStyleCollection()})
+
+    assert await db["jobs"].find({}).sort("_id", 1).to_list(None) == [{"_id": "a"}]
+    assert profile.spans["mongo"] >= DELAY * 1000 * 0.9
+
+    before = profile.spans["mongo"]
+    await db["jobs"].find_one({})
+    assert profile.spans["mongo"] - before >= DELAY * 1000 * 0.9
+
+
+async def test_detached_tasks_leave_the_request_profile(profile):
+    db = ProfiledDatabase({"jobs": MotorStyleCollection()})
+    plain = unwrap_db(db)
+
+    async def background():
+        assert current_profile.get() is None
+        return await plain["jobs"].find({}).to_list(None)
+
+    assert await detached_task(background()) == [{"_id": "a"}]
+    assert "mongo" not in profile.spans
@@ -0,0 +1,112 @@
+# server/tests/test_resumes.py
+import pytest
+from pymongo.errors import DuplicateKeyError
+
+from app import scoring
+from app.database import ensure_indexes
+from app.models import JOBS_COLLECTION, RESUMES_COLLECTION, USERS_COLLECTION
+from app.routers import resume_routes
+from app.routers.resume_routes import save_resume
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def rescores(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        resume_routes, "schedule_rescore",
+        lambda db, user_id, name, is_default: calls.append((name, is_default)),
+    )
+    return calls
+
+
+@pytest.fixture
+async def indexed_db(db):
+    await ensure_indexes(db)
+    return db
+
+
+async def defaults(db, user_id: str) -> list[str]:
+    cursor = db[RESUMES_COLLECTION].find({"user_id": user_id, "is_default": True})
+    return [doc["name"] async for doc in cursor]
+
+
+async def test_saving_a_name_again_updates_the_same_resume(indexed_db, rescores):
+    first = await save_resume(indexed_db, "u1", "cv", "python developer", False)
+    second = await save_resume(indexed_db, "u1", "cv", "python developer", False)
+    third = await save_resume(indexed_db, "u1", "cv", "go developer", False)
+
+    assert first["_id"] == second["_id"] == third["_id"]
+    stored = await indexed_db[RESUMES_COLLECTION].find_one({"_id": first["_id"]})
+    assert third["created_at"] == stored["created_at"]
+    assert stored["text"] == "go developer"
+    assert await indexed_db[RESUMES_COLLECTION].count_documents({"user_id": "u1"}) == 1
+    # The unchanged save doesn't rescore
+    assert rescores == [("cv", False), ("cv", False)]
+
+
+async def test_only_one_default_per_user(indexed_db, rescores):
+    await save_resume(indexed_db, "u1", "a", "python", True)
+    await save_resume(indexed_db, "u1", "b", "golang", True)
+    await save_resume(indexed_db, "u2", "c", "rust", True)
+
+    assert await defaults(indexed_db, "u1") == ["b"]
+    assert await defaults(indexed_db, "u2") == ["c"]
+    assert ("a", False) in rescores
+
+    with pytest.raises(DuplicateKeyError):
+        await indexed_db[RESUMES_COLLECTION].update_one({"name": "a"}, {"$set": {"is_default": True}})
+
+
+async def test_a_save_racing_another_retries(indexed_db, rescores, monkeypatch):
+    await save_resume(indexed_db, "u1", "cv", "python", False)
+    collection = type(indexed_db[RESUMES_COLLECTION])
+    original = collection.find_one_and_update
+    failures = []
+
+    async def racing(self, *args, **kwargs):
+        if kwargs.get("upsert") and not failures:
+            failures.append(1)
+            raise DuplicateKeyError("E11000 duplicate key")
+        return await original(self, *args, **kwargs)
+
+    monkeypatch.setattr(collection, "find_one_and_update", racing)
+    doc = await save_resume(indexed_db, "u1", "cv", "golang", True)
+
+    assert failures == [1]
+    assert doc["text"] == "golang"
+    assert await defaults(indexed_db, "u1") == ["cv"]
+
+
+async def test_rescore_skips_stale_writes_and_retries_them(db, monkeypatch):
+    monkeypatch.setattr(scoring.settings, "rescore_batch_pause_seconds", 0)
+    await db[USERS_COLLECTION].insert_one({"_id": "u1", "job_version": 2})
+    await db[RESUMES_COLLECTION].insert_one(
+        {"_id": "r1", "user_id": "u1", "name": "cv", "text": "python fastapi", "is_default": True}
+    )
+    await db[JOBS_COLLECTION].insert_many([
+        {"_id": "a", "user_id": "u1", "company": "Acme", "role": "chef", "version": 1},
+        {"_id": "b", "user_id": "u1", "company": "Beta", "role": "chef", "version": 2},
+    ])
+
+    original = scoring.score_jobs
+    edited = []
+
+    async def edit_while_scoring(db, user_id, docs, descriptions=None):
+        await original(db, user_id, docs, descriptions)
+        if not edited:
+            # A user edit lands between the read and the write
+            edited.append("a")
+            await db[JOBS_COLLECTION].update_one(
+                {"_id": "a"}, {"$set": {"role": "python fastapi"}, "$inc": {"version": 10}}
+            )
+
+    monkeypatch.setattr(scoring, "score_jobs", edit_while_scoring)
+    assert await scoring.rescore_jobs_for_resume(db, "u1", "cv", is_default=True) == 2
+
+    jobs = {doc["_id"]: doc async for doc in db[JOBS_COLLECTION].find()}
+    assert jobs["a"]["role"] == "python fastapi"
+    assert jobs["a"]["fit_score"] == 100.0
+    assert jobs["b"]["fit_score"] == 0.0
+    assert jobs["a"]["fit_resume"] == jobs["b"]["fit_resume"] == "cv"
@@ -0,0 +1,67 @@
+# server/tests/test_sync.py
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.config import settings
+from app.models import USERS_COLLECTION
+from app.sync import add_tombstones, current_version, reserve_versions
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def user(db):
+    await db[USERS_COLLECTION].insert_one({"_id": "u1", "job_version": 0})
+    return "u1"
+
+
+async def test_reserved_versions_are_hidden_until_the_write_lands(db, user):
+    async with reserve_versions(db, user, 3) as first:
+        assert first == 1
+        assert await current_version(db, user) == 0
+        async with reserve_versions(db, user) as later:
+            assert later == 4
+        # A later write finishing first doesn't move readers past the pending one
+        assert await current_version(db, user) == 0
+    assert await current_version(db, user) == 4
+
+
+async def test_abandoned_reservations_expire(db, user):
+    stale = datetime.utcnow() - timedelta(seconds=settings.sync_reservation_timeout_seconds + 1)
+    await db[USERS_COLLECTION].update_one({"_id": user}, {
+        "$set": {"job_version": 5},
+        "$push": {"pending_versions": {"token": "crashed", "floor": 2, "at": stale}},
+    })
+
+    assert await current_version(db, user) == 5
+    assert (await db[USERS_COLLECTION].find_one({"_id": user}))["pending_versions"] == []
+
+
+async def test_tombstones_get_one_version_each(db, user):
+    first = await add_tombstones(db, user, ["a", "b"])
+
+    assert first == 1
+    assert await current_version(db, user) == 2
+    assert await add_tombstones(db, user, []) == 0
+
+
+def test_delta_sync(client, auth):
+    jobs = [
+        client.post("/jobs/", json={"company": f"Co{i}", "role": "Dev", "job_link": "x"}, headers=auth).json()
+        for i in range(3)
+    ]
+    full = client.get("/jobs/sync", headers=auth).json()
+    assert [job["id"] for job in full["changed"]] == [job["id"] for job in jobs]
+    assert full["deleted"] == []
+
+    client.put(f"/jobs/{jobs[0]['id']}", json={"status": "offer"}, headers=auth)
+    client.delete(f"/jobs/{jobs[1]['id']}", headers=auth)
+    delta = client.get(f"/jobs/sync?since={full['version']}", headers=auth).json()
+
+    assert delta["version"] == full["version"] + 2
+    assert [(job["id"], job["status"]) for job in delta["changed"]] == [(jobs[0]["id"], "offer")]
+    assert delta["deleted"] == [jobs[1]["id"]]
+
+    unchanged = client.get(f"/jobs/sync?since={delta['version']}", headers=auth).json()
+    assert unchanged == {"version": delta["version"], "changed": [], "deleted": []}
@@ -0,0 +1,83 @@
+# server/tests/test_uploads.py
+import io
+import os
+import zipfile
+
+import pytest
+
+from app.config import settings
+from app.routers import resume_routes
+
+LIMIT = 100 * 1024
+
+
+def make_docx(text: str) -> bytes:
+    body = (
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f"<w:body><w:p><w:r><w:t>{text}</w:t></w:r></w:p></w:body></w:document>"
+    )
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("word/document.xml", body)
+    return buffer.getvalue()
+
+
+@pytest.fixture(autouse=True)
+def upload_settings(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "max_upload_bytes", LIMIT)
+    monkeypatch.setattr(settings, "upload_dir", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def no_save(monkeypatch):
+    """Fail if the route gets as far as copying the upload."""
+    async def save_upload(*args):
+        raise AssertionError("oversized upload reached the route")
+    monkeypatch.setattr(resume_routes, "save_upload", save_upload)
+
+
+def test_upload_extracts_text_and_deletes_the_file(client, auth, upload_settings):
+    files = {"file": ("cv.docx", make_docx("Python developer with FastAPI"), "application/octet-stream")}
+    response = client.post("/resumes/upload", files=files, data={"name": "cv"}, headers=auth)
+
+    assert response.status_code == 200, response.text
+    assert response.json()["text_length"] == len("Python developer with FastAPI")
+    assert os.listdir(upload_settings) == []
+
+
+def test_oversized_upload_is_rejected_from_content_length(client, auth, no_save):
+    files = {"file": ("cv.docx", b"x" * (LIMIT * 2), "application/octet-stream")}
+    response = client.post("/resumes/upload", files=files, data={"name": "cv"}, headers=auth)
+
+    assert response.status_code == 413
+
+
+def test_oversized_chunked_upload_is_cut_off(client, auth, no_save):
+    boundary = "testboundary"
+    head = (
+        f"--{boundary}\r\nContent-Disposition: form-data; name=\"name\"\r\n\r\ncv\r\n"
+        f"--{boundary}\r\nContent-Disposition: form-data; name=\"file\"; filename=\"cv.docx\"\r\n"
+        "Content-Type: application/octet-stream\r\n\r\n"
+    ).encode()
+
+    def body():
+        yield head
+        for _ in range(LIMIT // 1024 * 4):
+            yield b"x" * 1024
+        yield f"\r\n--{boundary}--\r\n".encode()
+
+    response = client.post(
+        "/resumes/upload",
+        content=body(),
+        headers={**auth, "Content-Type": f"multipart/form-data; boundary={boundary}"},
+    )
+
+    assert response.status_code == 413
+
+
+def test_unsupported_extension(client, auth):
+    files = {"file": ("cv.txt", b"plain text resume", "text/plain")}
+    response = client.post("/resumes/upload", files=files, data={"name": "cv"}, headers=auth)
+
+    assert response.status_code == 400
@@ -0,0 +1,103 @@
+# server/tests/test_user_indexes.py
+import pytest
+
+from app import user_indexes
+from app.models import USERS_COLLECTION
+from app.sync import reserve_versions
+from app.user_indexes import IndexStore
+
+pytestmark = pytest.mark.anyio
+
+
+class SetIndex:
+    """Minimal index: the set of job IDs."""
+
+    def __init__(self, version: int, docs: list[dict]):
+        self.version = version
+        self.ids = {doc["_id"] for doc in docs}
+
+    def upsert(self, doc: dict):
+        self.ids.add(doc["_id"])
+
+    def remove(self, job_id: str):
+        self.ids.discard(job_id)
+
+
+@pytest.fixture
+def store(monkeypatch):
+    monkeypatch.setattr(user_indexes, "_stores", [])
+    loads = []
+
+    async def load(db, user_id):
+        loads.append(user_id)
+        return await db["jobs"].find({"user_id": user_id}).to_list(None)
+
+    store = IndexStore(load, SetIndex, budget=lambda: 2)
+    store.loads = loads
+    return store
+
+
+async def add_job(db, user_id: str, job_id: str) -> dict:
+    async with reserve_versions(db, user_id) as version:
+        doc = {"_id": job_id, "user_id": user_id, "version": version}
+        await db["jobs"].insert_one(doc)
+    return doc
+
+
+async def test_reads_reload_when_the_version_moves(db, store):
+    await db[USERS_COLLECTION].insert_one({"_id": "u1", "job_version": 0})
+    await add_job(db, "u1", "a")
+
+    index = await store.get(db, "u1")
+    assert index.ids == {"a"}
+    assert await store.get(db, "u1") is index
+    assert store.loads == ["u1"]
+
+    # A write that bypassed the store (another process, a background task)
+    await add_job(db, "u1", "b")
+    index = await store.get(db, "u1")
+    assert index.ids == {"a", "b"}
+    assert store.loads == ["u1", "u1"]
+
+
+async def test_writes_apply_in_place_in_every_store(db, store):
+    await db[USERS_COLLECTION].insert_one({"_id": "u1", "job_version": 0})
+    index = await store.get(db, "u1")
+
+    user_indexes.apply_upsert("u1", await add_job(db, "u1", "a"))
+    async with reserve_versions(db, "u1") as version:
+        await db["jobs"].delete_one({"_id": "a"})
+    user_indexes.apply_delete("u1", "a", version)
+    user_indexes.apply_upsert("u1", await add_job(db, "u1", "b"))
+
+    assert await store.get(db, "u1") is index
+    assert index.ids == {"b"}
+    assert store.loads == ["u1"]
+
+
+async def test_a_missed_write_drops_the_index(db, store):
+    await db[USERS_COLLECTION].insert_one({"_id": "u1", "job_version": 0})
+    await store.get(db, "u1")
+    await add_job(db, "u1", "a")
+
+    user_indexes.apply_upsert("u1", await add_job(db, "u1", "b"))
+
+    assert "u1" not in store.indexes
+    assert (await store.get(db, "u1")).ids == {"a", "b"}
+
+
+async def test_least_recently_used_is_evicted(db, store):
+    for user_id in ("u1", "u2", "u3"):
+        await db[USERS_COLLECTION].insert_one({"_id": user_id, "job_version": 0})
+
+    await store.get(db, "u1")
+    await store.get(db, "u2")
+    await store.get(db, "u1")
+    await store.get(db, "u3")
+
+    assert list(store.indexes) == ["u1", "u3"]
+    assert store.total == 2
+
+    user_indexes.invalidate("u1")
+    assert list(store.indexes) == ["u3"]
+    assert store.total == 1